@@ -1,7 +1,31 @@
+import os
+import re
+import sys
+import time
+from array import array
+from collections import Counter
 from collections.abc import Mapping
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property, wraps
+from importlib import import_module
+from inspect import isgeneratorfunction
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
-from typing import Any, Iterator, Optional, Protocol, TypeVar
+from pkgutil import iter_modules
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Protocol,
+    TypeVar,
+)
+
+Line = str | bytes | memoryview
 
 
 def load_data(data_file: Path) -> list[str]:
@@ -9,6 +33,31 @@ def load_data(data_file: Path) -> list[str]:
         return [*data]
 
 
+def stream_data(data_file: Path) -> Iterator[str]:
+    with open(data_file) as data:
+        yield from data
+
+
+def map_data(data_file: Path) -> Iterator[memoryview]:
+    with open(data_file, "rb") as data:
+        if os.fstat(data.fileno()).st_size == 0:
+            return
+        mapped = mmap(data.fileno(), 0, access=ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    start = 0
+    while start < len(buffer):
+        end = mapped.find(b"\n", start)
+        end = len(buffer) if end < 0 else end + 1
+        yield buffer[start:end]
+        start = end
+
+
+def text_lines(data: Iterable[Line]) -> Iterator[str]:
+    for line in data:
+        yield line if isinstance(line, str) else str(line, "utf-8")
+
+
 T = TypeVar("T")
 
 
@@ -25,23 +74,315 @@ def no(*_args: Any) -> bool:
     return False
 
 
+@dataclass(frozen=True)
+class PhaseRecord:
+    name: str
+    phase: str
+    wall_time: float
+    cpu_time: float
+    peak_memory: Optional[int] = None
+
+
 @dataclass
-class PathMapping(Mapping[T, Optional[list[T]]]):
-    start: T
-    previous: dict[T, T]
+class Profiler:
+    trace_memory: bool = True
+    records: list[PhaseRecord] = field(default_factory=list)
+    _frames: list[list[int]] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def measure(self, name: str, phase: str) -> Iterator[None]:
+        import tracemalloc
+
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if len(self._frames) > 0:
+                self._frames[-1][1] = max(self._frames[-1][1], peak)
+            tracemalloc.reset_peak()
+            frame = [current, current]
+            self._frames.append(frame)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            peak_memory = None
+            if tracing:
+                del self._frames[
+                    next(i for i, f in enumerate(self._frames) if f is frame)
+                ]
+                peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+                peak_memory = peak - frame[0]
+                if len(self._frames) > 0:
+                    self._frames[-1][1] = max(self._frames[-1][1], peak)
+
+            self.records.append(
+                PhaseRecord(name, phase, wall_time, cpu_time, peak_memory)
+            )
+
+
+_profiler: Optional[Profiler] = None
+
+
+@contextmanager
+def profiling(trace_memory: bool = True) -> Iterator[Profiler]:
+    import tracemalloc
+
+    global _profiler
+    previous = _profiler
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    _profiler = Profiler(trace_memory=trace_memory)
+    try:
+        yield _profiler
+    finally:
+        _profiler = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def profiled(phase: str) -> Callable[[Callable], Callable]:
+    def decorate(fn: Callable) -> Callable:
+        name = f"{fn.__module__}.{fn.__qualname__}"
+
+        if isgeneratorfunction(fn):
+
+            def measure_iteration(profiler: Profiler, iterator: Iterator) -> Iterator:
+                with profiler.measure(name, phase):
+                    return (yield from iterator)
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if _profiler is None:
+                    return fn(*args, **kwargs)
+                return measure_iteration(_profiler, fn(*args, **kwargs))
+
+        else:
+
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if _profiler is None:
+                    return fn(*args, **kwargs)
+                with _profiler.measure(name, phase):
+                    return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+_stats: Optional[Counter[str]] = None
+
+
+@contextmanager
+def counting() -> Iterator[Counter[str]]:
+    global _stats
+    previous = _stats
+    _stats = Counter()
+    try:
+        yield _stats
+    finally:
+        _stats = previous
+
+
+def count(name: str, n: int = 1) -> None:
+    if _stats is not None:
+        _stats[name] += n
+
+
+@dataclass(frozen=True)
+class Solution(Generic[T]):
+    load: Callable[[Path], T]
+    parts: dict[str, Callable[[T], Any]]
+
+
+Position = tuple[int, int]
+
+
+class Grid:
+    def __init__(
+        self,
+        height: int,
+        width: int,
+        fill: int = 0,
+        typecode: str = "B",
+        cells: Optional[array] = None,
+    ):
+        self.height = height
+        self.width = width
+        self.cells = (
+            array(typecode, [fill]) * (height * width) if cells is None else cells
+        )
+        if len(self.cells) != height * width:
+            raise ValueError(f"expected {height * width} cells, got {len(self.cells)}")
+
+    @staticmethod
+    def from_rows(rows: Iterable[Iterable[int]], typecode: str = "B") -> "Grid":
+        cells = array(typecode)
+        widths = set()
+        height = 0
+        for row in rows:
+            start = len(cells)
+            cells.extend(row)
+            widths.add(len(cells) - start)
+            height += 1
+
+        if len(widths) > 1:
+            raise ValueError(f"rows have different widths: {sorted(widths)}")
+
+        return Grid(height, widths.pop() if widths else 0, cells=cells)
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return (self.height, self.width, self.cells) == (
+                other.height,
+                other.width,
+                other.cells,
+            )
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"Grid(height={self.height}, width={self.width})"
+
+    def __contains__(self, position: Position) -> bool:
+        return 0 <= position[0] < self.height and 0 <= position[1] < self.width
+
+    def __getitem__(self, position: Position) -> int:
+        if position not in self:
+            raise IndexError(f"position out of bounds: {position}")
+        return self.cells[position[0] * self.width + position[1]]
+
+    def __setitem__(self, position: Position, value: int) -> None:
+        if position not in self:
+            raise IndexError(f"position out of bounds: {position}")
+        self.cells[position[0] * self.width + position[1]] = value
+
+    def get(self, position: Position, default: Optional[int] = None) -> Optional[int]:
+        if position not in self:
+            return default
+        return self.cells[position[0] * self.width + position[1]]
+
+    def positions(self) -> Iterator[Position]:
+        for row in range(self.height):
+            for column in range(self.width):
+                yield row, column
+
+    def neighbors(self, position: Position) -> Iterator[Position]:
+        row, column = position
+        if row + 1 < self.height:
+            yield row + 1, column
+        if row > 0:
+            yield row - 1, column
+        if column + 1 < self.width:
+            yield row, column + 1
+        if column > 0:
+            yield row, column - 1
+
+    def row(self, index: int) -> memoryview:
+        if not 0 <= index < self.height:
+            raise IndexError(f"row out of bounds: {index}")
+        return memoryview(self.cells)[index * self.width : (index + 1) * self.width]
+
+    def column(self, index: int) -> memoryview:
+        if not 0 <= index < self.width:
+            raise IndexError(f"column out of bounds: {index}")
+        return memoryview(self.cells)[index :: self.width]
+
+
+class DayRegistry(Mapping[str, ModuleType]):
+    pattern = re.compile(r"day\d{2}")
+
+    def __init__(self, package: str = __name__):
+        self.package = package
+
+    @cached_property
+    def names(self) -> list[str]:
+        return sorted(
+            m.name
+            for m in iter_modules(sys.modules[self.package].__path__)
+            if self.pattern.fullmatch(m.name)
+        )
+
+    def __getitem__(self, day: str) -> ModuleType:
+        if day not in self.names:
+            raise KeyError(day)
+
+        return import_module(f"{self.package}.{day}")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def solution(self, day: str) -> Solution:
+        return self[day].SOLUTION
+
+
+DAYS = DayRegistry()
+
+
+class PathIndex(Mapping[T, list[T]]):
+    def __init__(self, start: T):
+        self.start = start
+        self._ids: dict[T, int] = {start: 0}
+        self._nodes: list[T] = [start]
+        self._parents = array("q", [-1])
+        self._depths = array("q", [0])
+        self._children = array("q", [0])
+
+    def add(self, node: T, previous: T) -> None:
+        previous_id = self._ids[previous]
+        depth = self._depths[previous_id] + 1
+        if (node_id := self._ids.get(node)) is None:
+            self._ids[node] = len(self._nodes)
+            self._nodes.append(node)
+            self._parents.append(previous_id)
+            self._depths.append(depth)
+            self._children.append(0)
+        elif node_id > 0:
+            if self._children[node_id] > 0:
+                raise ValueError(f"cannot re-parent {node!r}, which has children")
+            self._children[self._parents[node_id]] -= 1
+            self._parents[node_id] = previous_id
+            self._depths[node_id] = depth
+        else:
+            return
+
+        self._children[previous_id] += 1
+
+    def depth(self, node: T) -> int:
+        return self._depths[self._ids[node]]
+
+    def depths(self, nodes: Iterable[T]) -> list[Optional[int]]:
+        ids = map(self._ids.get, nodes)
+        return [None if i is None else self._depths[i] for i in ids]
+
+    def walk(self, node: T) -> Iterator[T]:
+        return self._walk(self._ids[node])
+
+    def walks(self, nodes: Iterable[T]) -> Iterator[Optional[Iterator[T]]]:
+        for node_id in map(self._ids.get, nodes):
+            yield None if node_id is None else self._walk(node_id)
+
+    def _walk(self, node_id: int) -> Iterator[T]:
+        while node_id >= 0:
+            yield self._nodes[node_id]
+            node_id = self._parents[node_id]
 
-    def __getitem__(self, key: tuple[T]) -> Optional[list[T]]:
-        path = []
-        current = key
-        while not current == self.start:
-            path.append(current)
-            current = self.previous[current]
+    def __getitem__(self, node: T) -> list[T]:
+        return [*self.walk(node)]
 
-        path.append(self.start)
-        return path
+    def __contains__(self, node: object) -> bool:
+        return node in self._ids
 
     def __len__(self) -> int:
-        return len(self.previous)
+        return len(self._nodes)
 
-    def __iter__(self) -> Iterator[tuple[int, int]]:
-        return iter(self.previous)
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._nodes)
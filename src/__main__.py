@@ -0,0 +1,30 @@
+import json
+import sys
+from argparse import ArgumentParser
+
+from src.cache import ParseCache
+from src.runner import day_name, jobs_for, run_jobs
+
+
+def main(argv: list[str]) -> int:
+    parser = ArgumentParser(prog="python -m src")
+    parser.add_argument("--days", nargs="+", type=day_name, required=True)
+    parser.add_argument("--inputs", nargs="*", default=[])
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--cache-max-bytes", type=int, default=ParseCache.max_bytes)
+    args = parser.parse_args(argv)
+
+    cache = ParseCache(max_bytes=args.cache_max_bytes, enabled=not args.no_cache)
+    jobs = jobs_for(args.days, args.inputs, cache)
+
+    failed = False
+    for result in run_jobs(jobs, args.processes):
+        failed = failed or "error" in result
+        print(json.dumps(result), flush=True)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,438 @@
+import gc
+import json
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from random import Random
+from statistics import median
+from typing import Callable, Iterable, Iterator, Optional
+
+from src import DAYS, Solution
+
+Generator = Callable[[int, Random], Iterator[str]]
+
+
+def generate_day01(size: int, rng: Random) -> Iterator[str]:
+    for i in range(size):
+        if i > 0:
+            yield "\n"
+        for _ in range(rng.randint(1, 10)):
+            yield f"{rng.randint(1000, 60000)}\n"
+
+
+def generate_day02(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
+
+
+def generate_day03(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(max(1, size // 3)):
+        types = [*string.ascii_letters]
+        rng.shuffle(types)
+        badge, pools = types[0], [types[1:18], types[18:35], types[35:52]]
+        for pool in pools:
+            first_types, second_types = pool[:8], pool[8:]
+            common = rng.choice(first_types)
+            length = rng.randint(8, 16)
+            first = [badge, common] + rng.choices(first_types, k=length - 2)
+            second = [common] + rng.choices(second_types, k=length - 1)
+            rng.shuffle(first)
+            rng.shuffle(second)
+            yield "".join(first + second) + "\n"
+
+
+def generate_day04(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        a, b, c, d = (rng.randint(1, 99) for _ in range(4))
+        yield f"{min(a, b)}-{max(a, b)},{min(c, d)}-{max(c, d)}\n"
+
+
+def generate_day05(size: int, rng: Random) -> Iterator[str]:
+    num_stacks = 9
+    heights = [1 + size // num_stacks] * num_stacks
+    for row in range(max(heights) - 1, -1, -1):
+        yield " ".join(
+            f"[{rng.choice(string.ascii_uppercase)}]" if row < h else "   "
+            for h in heights
+        ) + "\n"
+    yield " ".join(f" {i + 1} " for i in range(num_stacks)) + "\n"
+    yield "\n"
+
+    for _ in range(size):
+        start = rng.choice([i for i, h in enumerate(heights) if h > 0])
+        end = rng.choice([i for i in range(num_stacks) if i != start])
+        n = rng.randint(1, heights[start])
+        heights[start] -= n
+        heights[end] += n
+        yield f"move {n} from {start + 1} to {end + 1}\n"
+
+
+def generate_day06(size: int, rng: Random) -> Iterator[str]:
+    yield "".join(rng.choices("abc", k=size)) + string.ascii_lowercase[3:21] + "\n"
+
+
+def generate_day07(size: int, rng: Random, max_depth: int = 200) -> Iterator[str]:
+    children: list[list[int]] = [[]]
+    depths = [0]
+    for i in range(1, size):
+        parent = rng.randrange(max(0, i - 8), i)
+        if depths[parent] >= max_depth:
+            parent = 0
+        children[parent].append(i)
+        children.append([])
+        depths.append(depths[parent] + 1)
+
+    yield "$ cd /\n"
+    unexplored: list[int | None] = [0]
+    while len(unexplored) > 0:
+        directory = unexplored.pop()
+        if directory is None:
+            yield "$ cd ..\n"
+            continue
+        if directory > 0:
+            yield f"$ cd d{directory}\n"
+            unexplored.append(None)
+
+        yield "$ ls\n"
+        for child in children[directory]:
+            yield f"dir d{child}\n"
+        for j in range(rng.randint(0, 4)):
+            yield f"{rng.randint(1, 300000)} f{j}.txt\n"
+
+        unexplored.extend(reversed(children[directory]))
+
+
+def generate_day08(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        yield "".join(rng.choices(string.digits, k=size)) + "\n"
+
+
+def generate_day09(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 9)}\n"
+
+
+def generate_day10(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        if rng.random() < 0.3:
+            yield "noop\n"
+        else:
+            yield f"addx {rng.randint(-5, 5) or 1}\n"
+
+
+def generate_day11(size: int, rng: Random) -> Iterator[str]:
+    primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47]
+    num_monkeys = max(2, size)
+    for i in range(num_monkeys):
+        if i == 0:
+            operation = "old * old"
+        elif rng.random() < 0.5:
+            operation = f"old * {rng.randint(2, 19)}"
+        else:
+            operation = f"old + {rng.randint(1, 9)}"
+        if_true, if_false = rng.sample([j for j in range(num_monkeys) if j != i], 2)
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 6)))
+        if i > 0:
+            yield "\n"
+        yield f"Monkey {i}:\n"
+        yield f"  Starting items: {items}\n"
+        yield f"  Operation: new = {operation}\n"
+        yield f"  Test: divisible by {rng.choice(primes)}\n"
+        yield f"    If true: throw to monkey {if_true}\n"
+        yield f"    If false: throw to monkey {if_false}\n"
+
+
+def generate_day12(size: int, rng: Random) -> Iterator[str]:
+    n = max(size, 14)
+    for r in range(n):
+        row = []
+        for c in range(n):
+            level = (r + c) * 25 // (2 * n - 2)
+            if 0 < r and c < n - 1 and rng.random() < 0.2:
+                level = rng.randint(0, level)
+            row.append(string.ascii_lowercase[level])
+        if r == 0:
+            row[0] = "S"
+        if r == n - 1:
+            row[-1] = "E"
+        yield "".join(row) + "\n"
+
+
+def _generate_packet_data(rng: Random, depth: int = 0) -> list:
+    return [
+        _generate_packet_data(rng, depth + 1)
+        if depth < 4 and rng.random() < 0.3
+        else rng.randint(0, 10)
+        for _ in range(rng.randint(0, 5))
+    ]
+
+
+def generate_day13(size: int, rng: Random) -> Iterator[str]:
+    for i in range(size):
+        if i > 0:
+            yield "\n"
+        for _ in range(2):
+            yield json.dumps(_generate_packet_data(rng), separators=(",", ":")) + "\n"
+
+
+def generate_day14(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        x, y = rng.randint(500 - size, 500 + size), rng.randint(2, 2 + size)
+        locations = [(x, y)]
+        for i in range(rng.randint(1, 4)):
+            if i % 2 == 0:
+                x += rng.choice((-1, 1)) * rng.randint(1, 10)
+            else:
+                y = max(1, y + rng.choice((-1, 1)) * rng.randint(1, 10))
+            locations.append((x, y))
+        yield " -> ".join(f"{x},{y}" for (x, y) in locations) + "\n"
+
+
+def generate_day15(size: int, rng: Random) -> Iterator[str]:
+    for _ in range(size):
+        sx, sy = rng.randint(0, 4000000), rng.randint(1900000, 2100000)
+        dx = rng.randint(-100000, 100000)
+        dy = rng.choice((-1, 1)) * rng.randint(0, 100000 - abs(dx))
+        yield (
+            f"Sensor at x={sx}, y={sy}: "
+            f"closest beacon is at x={sx + dx}, y={sy + dy}\n"
+        )
+
+
+GENERATORS: dict[str, Generator] = {
+    "day01": generate_day01,
+    "day02": generate_day02,
+    "day03": generate_day03,
+    "day04": generate_day04,
+    "day05": generate_day05,
+    "day06": generate_day06,
+    "day07": generate_day07,
+    "day08": generate_day08,
+    "day09": generate_day09,
+    "day10": generate_day10,
+    "day11": generate_day11,
+    "day12": generate_day12,
+    "day13": generate_day13,
+    "day14": generate_day14,
+    "day15": generate_day15,
+}
+
+
+@dataclass
+class Measurement:
+    day: str
+    size: int
+    input_bytes: int
+    phase: str
+    samples: list[float] = field(default_factory=list)
+    peak_memory: Optional[int] = None
+    calibration: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.day}/{self.phase}/{self.size}"
+
+    @property
+    def median(self) -> float:
+        return median(self.samples)
+
+    @property
+    def deviation(self) -> float:
+        return median(abs(sample - self.median) for sample in self.samples)
+
+    @property
+    def throughput(self) -> float:
+        return self.input_bytes / self.median / 1e6
+
+    def to_dict(self) -> dict:
+        return asdict(self) | {
+            "median": self.median,
+            "min": min(self.samples),
+            "deviation": self.deviation,
+            "throughput": self.throughput,
+        }
+
+
+def write_input(day: str, size: int, directory: Path, seed: int = 0) -> Path:
+    data_file = directory / f"{day}-{size}.txt"
+    with open(data_file, "w") as data:
+        data.writelines(GENERATORS[day](size, Random(f"{seed}-{day}-{size}")))
+
+    return data_file
+
+
+def time_call(fn: Callable[[], object]) -> float:
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def trace_call(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        fn()
+        return tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+
+
+def measure(
+    day: str, solution: Solution, data_file: Path, size: int, repeat: int = 3
+) -> Iterator[Measurement]:
+    input_bytes = data_file.stat().st_size
+    loading = Measurement(day, size, input_bytes, "load")
+    for _ in range(repeat):
+        loading.samples.append(time_call(lambda: solution.load(data_file)))
+    loading.peak_memory = trace_call(lambda: solution.load(data_file))
+    yield loading
+
+    for name, part in solution.parts.items():
+        solving = Measurement(day, size, input_bytes, name)
+        for _ in range(repeat):
+            data = solution.load(data_file)
+            solving.samples.append(time_call(lambda: part(data)))
+        data = solution.load(data_file)
+        solving.peak_memory = trace_call(lambda: part(data))
+        yield solving
+
+
+def run(
+    days: Iterable[str], sizes: Iterable[int], repeat: int = 3, seed: int = 0
+) -> Iterator[Measurement]:
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            solution = DAYS.solution(day)
+            for size in sizes:
+                data_file = write_input(day, size, Path(directory), seed=seed)
+                yield from measure(day, solution, data_file, size, repeat=repeat)
+
+
+def run_loaders(
+    days: Iterable[str], sizes: Iterable[int], repeat: int = 3, seed: int = 0
+) -> Iterator[Measurement]:
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            loaders = getattr(DAYS[day], "LOADERS", {"load": DAYS.solution(day).load})
+            for size in sizes:
+                data_file = write_input(day, size, Path(directory), seed=seed)
+                input_bytes = data_file.stat().st_size
+                for name, loader in loaders.items():
+                    loading = Measurement(day, size, input_bytes, name)
+                    for _ in range(repeat):
+                        loading.samples.append(time_call(lambda: loader(data_file)))
+                    yield loading
+
+
+def measure_imports(modules: Iterable[str], repeat: int = 3) -> Iterator[Measurement]:
+    script = (
+        "import sys, time; start = time.perf_counter(); "
+        "__import__(sys.argv[1]); print(time.perf_counter() - start)"
+    )
+    for module in modules:
+        importing = Measurement(module, 0, 0, "import")
+        for _ in range(repeat):
+            completed = subprocess.run(
+                [sys.executable, "-c", script, module],
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            importing.samples.append(float(completed.stdout))
+        yield importing
+
+
+def report(measurements: Iterable[Measurement]) -> dict:
+    return {
+        "python": sys.version,
+        "measurements": [m.to_dict() for m in measurements],
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+
+def calibrate(repeat: int = 5, n: int = 20_000) -> float:
+    def workload():
+        values = {i: str(i * 7919 % n) for i in range(n)}
+        return sorted(values.values(), key=lambda value: (len(value), value))
+
+    return median(time_call(workload) for _ in range(repeat))
+
+
+def calibrated(measurements: Iterable[Measurement]) -> Iterator[Measurement]:
+    for m in measurements:
+        m.calibration = calibrate()
+        yield m
+
+
+def baseline(measurements: Iterable[Measurement]) -> dict:
+    return {
+        "python": sys.version,
+        "entries": {
+            m.key: {
+                "median": m.median,
+                "deviation": m.deviation,
+                "peak_memory": m.peak_memory,
+                "calibration": m.calibration,
+            }
+            for m in calibrated(measurements)
+        },
+    }
+
+
+def baseline_cases(entries: dict[str, dict]) -> dict[str, list[int]]:
+    cases: dict[str, set[int]] = {}
+    for key in entries:
+        day, _, size = key.split("/")
+        cases.setdefault(day, set()).add(int(size))
+
+    return {day: sorted(sizes) for day, sizes in cases.items()}
+
+
+def compare(
+    entries: dict[str, dict],
+    measurements: Iterable[Measurement],
+    time_tolerance: float = 0.25,
+    noise_factor: float = 3.0,
+    time_floor: float = 1e-3,
+    memory_tolerance: float = 0.1,
+    memory_floor: int = 4096,
+) -> Iterator[Regression]:
+    for m in measurements:
+        if (entry := entries.get(m.key)) is None:
+            continue
+
+        scale = 1.0
+        if entry.get("calibration") and m.calibration:
+            scale = m.calibration / entry["calibration"]
+        expected = scale * entry["median"]
+        slowdown = m.median - expected
+        noise = noise_factor * max(scale * entry["deviation"], m.deviation)
+        if slowdown > max(time_tolerance * expected, noise, time_floor):
+            yield Regression(m.key, "time", expected, m.median)
+
+        if entry["peak_memory"] is not None and m.peak_memory is not None:
+            growth = m.peak_memory - entry["peak_memory"]
+            if (
+                growth > memory_tolerance * entry["peak_memory"]
+                and growth > memory_floor
+            ):
+                yield Regression(m.key, "memory", entry["peak_memory"], m.peak_memory)
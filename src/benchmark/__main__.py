@@ -0,0 +1,108 @@
+import json
+import os
+import sys
+from argparse import ArgumentParser
+from typing import Iterator
+
+from src import DAYS
+from src.benchmark import (
+    Measurement,
+    baseline,
+    baseline_cases,
+    calibrated,
+    compare,
+    measure_imports,
+    report,
+    run,
+    run_loaders,
+)
+
+
+def main(argv: list[str]) -> int:
+    parser = ArgumentParser(prog="python -m src.benchmark")
+    parser.add_argument("--days", nargs="+", default=[*DAYS])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-")
+    parser.add_argument("--imports", action="store_true")
+    parser.add_argument("--loaders", action="store_true")
+    parser.add_argument("--record-baseline", metavar="PATH")
+    parser.add_argument("--check-baseline", metavar="PATH")
+    parser.add_argument("--attempts", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.check_baseline:
+        return check_baseline(
+            args.check_baseline, args.repeat, args.seed, args.attempts
+        )
+
+    if args.imports:
+        modules = ["src", *(f"src.{day}" for day in args.days)]
+        measurements = measure_imports(modules, repeat=args.repeat)
+    elif args.loaders:
+        measurements = run_loaders(
+            args.days, args.sizes, repeat=args.repeat, seed=args.seed
+        )
+    else:
+        measurements = run(args.days, args.sizes, repeat=args.repeat, seed=args.seed)
+
+    if args.record_baseline:
+        with open(args.record_baseline, "w") as output:
+            json.dump(baseline(measurements), output, indent=2)
+        return 0
+
+    results = report(measurements)
+    if args.output == "-":
+        json.dump(results, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    return 0
+
+
+def measure_cases(
+    entries: dict[str, dict], repeat: int, seed: int
+) -> Iterator[Measurement]:
+    cases = baseline_cases(entries)
+    sizes = sorted({size for sizes in cases.values() for size in sizes})
+    return run(cases, sizes, repeat=repeat, seed=seed)
+
+
+def find_regressions(entries: dict[str, dict], repeat: int, seed: int) -> list:
+    measurements = calibrated(measure_cases(entries, repeat, seed))
+    return [*compare(entries, measurements)]
+
+
+def check_baseline(path: str, repeat: int, seed: int, attempts: int = 3) -> int:
+    with open(path) as data:
+        entries = json.load(data)["entries"]
+
+    regressions = find_regressions(entries, repeat, seed)
+    for _ in range(attempts):
+        if not regressions:
+            break
+        suspects = {(r.key, r.metric) for r in regressions}
+        regressions = [
+            r
+            for r in find_regressions(
+                {key: entries[key] for key, _ in suspects}, repeat, seed
+            )
+            if (r.key, r.metric) in suspects
+        ]
+
+    for r in regressions:
+        print(
+            f"{r.key}: {r.metric} regressed from {r.baseline:.6g} to {r.current:.6g}",
+            file=sys.stderr,
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    if "PYTHONHASHSEED" not in os.environ:
+        os.environ["PYTHONHASHSEED"] = "0"
+        os.execv(sys.executable, [sys.executable, "-m", "src.benchmark", *sys.argv[1:]])
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,95 @@
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional
+
+import src
+from src import DAYS
+
+CACHE_DIRECTORY_NAME = ".parse-cache"
+PACKAGE_NAME = "advent-of-code-2022"
+
+
+def content_hash(data_file: Path, chunk_size: int = 2**20) -> str:
+    digest = hashlib.sha256()
+    with open(data_file, "rb") as data:
+        while chunk := data.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def package_version() -> str:
+    try:
+        return version(PACKAGE_NAME)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+@cache
+def code_hash(day: str) -> str:
+    digest = hashlib.sha256(package_version().encode())
+    for module in (src, DAYS[day]):
+        digest.update(content_hash(Path(module.__file__)).encode())
+
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class ParseCache:
+    max_bytes: int = 256 * 2**20
+    enabled: bool = True
+
+    def path_for(self, day: str, data_file: Path, digest: Optional[str] = None) -> Path:
+        key = f"{day}-{code_hash(day)}-{digest or content_hash(data_file)}.pickle"
+        return Path(data_file).parent / CACHE_DIRECTORY_NAME / key
+
+    def load(self, day: str, data_file: Path, digest: Optional[str] = None) -> Any:
+        solution = DAYS.solution(day)
+        if not self.enabled:
+            return solution.load(data_file)
+
+        cache_file = self.path_for(day, data_file, digest)
+        try:
+            with open(cache_file, "rb") as cached:
+                data = pickle.load(cached)
+            os.utime(cache_file)
+            return data
+        except Exception:
+            pass
+
+        data = solution.load(data_file)
+        try:
+            self.store(cache_file, data)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+        return data
+
+    def store(self, cache_file: Path, data: Any) -> None:
+        cache_file.parent.mkdir(exist_ok=True)
+        partial_file = cache_file.with_suffix(f".{os.getpid()}.partial")
+        try:
+            with open(partial_file, "wb") as partial:
+                pickle.dump(data, partial, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_file, cache_file)
+        finally:
+            partial_file.unlink(missing_ok=True)
+
+        self.evict(cache_file.parent)
+
+    def evict(self, directory: Path) -> None:
+        entries = sorted(
+            ((f.stat(), f) for f in directory.glob("*.pickle")),
+            key=lambda entry: entry[0].st_mtime,
+        )
+        total_bytes = sum(stat.st_size for stat, _ in entries)
+        for stat, cache_file in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            cache_file.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
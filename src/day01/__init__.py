@@ -1,6 +1,17 @@
+import heapq
+import math
+import os
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import accumulate, chain, pairwise
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
+from src import Line, Solution, profiled, stream_data, text_lines
 
+
+@profiled("parse")
 def load(data_file: Path):
     elves = []
     with open(data_file) as calorie_data:
@@ -61,4 +72,193 @@ def get_max_elf_calorie_count(elves: list[Elf]):
 
 
 def get_top_three_elf_calorie_counts(elves: list[Elf]):
-    return sorted([elf_calorie_count(elf) for elf in elves], reverse=True)[:3]
+    return heapq.nlargest(3, (elf_calorie_count(elf) for elf in elves))
+
+
+def calorie_totals(lines: Iterable[Line]) -> Iterator[int]:
+    total = None
+    for line in text_lines(lines):
+        if line.isspace() or not line:
+            if total is not None:
+                yield total
+            total = None
+        else:
+            total = (total or 0) + int(line)
+
+    if total is not None:
+        yield total
+
+
+@profiled("solve")
+def top_k(path_or_lines: str | os.PathLike | Iterable[Line], k: int) -> list[int]:
+    if isinstance(path_or_lines, (str, os.PathLike)):
+        path_or_lines = stream_data(Path(path_or_lines))
+
+    return heapq.nlargest(k, calorie_totals(path_or_lines))
+
+
+@dataclass
+class Inventory(Sequence[Elf]):
+    calories: array = field(default_factory=lambda: array("q"))
+    offsets: array = field(default_factory=lambda: array("q", [0]))
+    totals: array = field(init=False, repr=False)
+    _prefix_totals: array = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        self.totals = array(
+            "q", (sum(self.calories[a:b]) for a, b in pairwise(self.offsets))
+        )
+        self._prefix_totals = array("q", accumulate(self.totals, initial=0))
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+    def __getitem__(self, index: int) -> Elf:
+        index = range(len(self))[index]
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return Elf([FoodItem(ct) for ct in self.calories[start:end]])
+
+    def max(self) -> int:
+        return max(self.totals)
+
+    def top_k(self, k: int) -> list[int]:
+        return heapq.nlargest(k, self.totals)
+
+    def percentile(self, p: float) -> int:
+        if not self.totals:
+            raise ValueError("percentile of an empty inventory")
+        if not 0 <= p <= 100:
+            raise ValueError(f"percentile must be between 0 and 100, got {p}")
+
+        rank = max(math.ceil(p / 100 * len(self.totals)), 1)
+        return sorted(self.totals)[rank - 1]
+
+    def range_sum(self, start: int, stop: int) -> int:
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return self._prefix_totals[max(stop, start)] - self._prefix_totals[start]
+
+
+@profiled("parse")
+def parse_inventory(lines: Iterable[Line]) -> Inventory:
+    calories = array("q")
+    offsets = array("q", [0])
+    for line in text_lines(lines):
+        if line.isspace() or not line:
+            if len(calories) > offsets[-1]:
+                offsets.append(len(calories))
+        else:
+            calories.append(int(line))
+
+    if len(calories) > offsets[-1]:
+        offsets.append(len(calories))
+
+    return Inventory(calories, offsets)
+
+
+def load_inventory(data_file: Path) -> Inventory:
+    return parse_inventory(stream_data(data_file))
+
+
+def chunk_boundaries(data_file: Path, chunks: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(data_file)
+    boundaries = [0]
+    with open(data_file, "rb") as data:
+        for i in range(1, chunks):
+            position = max(size * i // chunks, boundaries[-1])
+            data.seek(position)
+            if position > 0:
+                data.readline()
+            while (line := data.readline()) and not line.isspace():
+                pass
+            boundaries.append(data.tell())
+
+    boundaries.append(size)
+    return [(start, end) for start, end in pairwise(boundaries) if start < end]
+
+
+def summarize_chunk(data_file: Path, start: int, end: int, k: int) -> list[int]:
+    with open(data_file, "rb") as data:
+        data.seek(start)
+        chunk = data.read(end - start)
+
+    return heapq.nlargest(k, calorie_totals(chunk.decode().splitlines()))
+
+
+@profiled("solve")
+def parallel_top_k(
+    data_file: Path, k: int, processes: int | None = None, chunks: int | None = None
+) -> list[int]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    processes = processes or os.cpu_count() or 1
+    ranges = chunk_boundaries(data_file, chunks or 4 * processes)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        summaries = [
+            executor.submit(summarize_chunk, data_file, start, end, k)
+            for start, end in ranges
+        ]
+        return heapq.nlargest(k, chain.from_iterable(s.result() for s in summaries))
+
+
+@dataclass
+class CalorieAggregator:
+    k: int = 3
+    offset: int = 0
+    _top: list[int] = field(default_factory=list, repr=False)
+    _open_total: Optional[int] = field(default=None, repr=False)
+    _partial_line: str = field(default="", repr=False)
+
+    @staticmethod
+    def from_totals(totals: Iterable[int], k: int = 3) -> "CalorieAggregator":
+        aggregator = CalorieAggregator(k)
+        for total in totals:
+            aggregator.add_total(total)
+        return aggregator
+
+    def add_total(self, total: int):
+        if len(self._top) < self.k:
+            heapq.heappush(self._top, total)
+        elif total > self._top[0]:
+            heapq.heapreplace(self._top, total)
+
+    def update(self, lines: Iterable[Line]):
+        for line in text_lines(lines):
+            if line.strip() == "":
+                if self._open_total is not None:
+                    self.add_total(self._open_total)
+                self._open_total = None
+            else:
+                self._open_total = (self._open_total or 0) + int(line)
+
+    def update_from(self, data_file: Path):
+        with open(data_file, "rb") as data:
+            data.seek(self.offset)
+            appended = data.read()
+
+        self.offset += len(appended)
+        lines = (self._partial_line + appended.decode()).splitlines(keepends=True)
+        self._partial_line = ""
+        if len(lines) > 0 and not lines[-1].endswith("\n"):
+            self._partial_line = lines.pop()
+        self.update(lines)
+
+    def top_k(self) -> list[int]:
+        open_total = self._open_total
+        if self._partial_line.strip():
+            open_total = (open_total or 0) + int(self._partial_line)
+
+        if open_total is None:
+            return sorted(self._top, reverse=True)
+        return heapq.nlargest(self.k, [*self._top, open_total])
+
+    def max(self) -> int:
+        return self.top_k()[0]
+
+
+SOLUTION = Solution(
+    load=load_inventory,
+    parts={
+        "part_one": Inventory.max,
+        "part_two": lambda inventory: sum(inventory.top_k(3)),
+    },
+)
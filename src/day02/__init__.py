@@ -1,5 +1,12 @@
+import os
+from collections import Counter
 from enum import Enum
+from itertools import product
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from src import Solution, profiled
 
 
 class Play(Enum):
@@ -58,9 +65,30 @@ def _outcome_score(player: Player, winner: Player | None):
 
 
 class Round:
-    def __init__(self, player_one_play: Play, player_two_play: Play):
-        self.player_one_play = player_one_play
-        self.player_two_play = player_two_play
+    _instances: dict[tuple[Play, Play], "Round"] = {}
+
+    player_one_play: Play
+    player_two_play: Play
+    winner: Player | None
+    player_one_score: int
+    player_two_score: int
+
+    def __new__(cls, player_one_play: Play, player_two_play: Play):
+        key = (player_one_play, player_two_play)
+        if (instance := cls._instances.get(key)) is None:
+            instance = super().__new__(cls)
+            instance.player_one_play = player_one_play
+            instance.player_two_play = player_two_play
+            instance.winner = Round._winner(player_one_play, player_two_play)
+            instance.player_one_score = _play_score(player_one_play) + _outcome_score(
+                Player.PLAYER_ONE, instance.winner
+            )
+            instance.player_two_score = _play_score(player_two_play) + _outcome_score(
+                Player.PLAYER_TWO, instance.winner
+            )
+            cls._instances[key] = instance
+
+        return instance
 
     def __eq__(self, other):
         if isinstance(other, Round):
@@ -71,6 +99,11 @@ class Round:
         else:
             return NotImplemented
 
+    __hash__ = object.__hash__
+
+    def __reduce__(self):
+        return Round, (self.player_one_play, self.player_two_play)
+
     @staticmethod
     def by_play_mapping(round_data: str):
         return Round(*PLAY_MAP[round_data])
@@ -79,61 +112,100 @@ class Round:
     def by_outcome_mapping(round_data: str):
         return Round(*OUTCOME_MAP[round_data])
 
-    @property
-    def winner(self) -> Player | None:
+    @staticmethod
+    def _winner(player_one_play: Play, player_two_play: Play) -> Player | None:
         if (
-            self.player_one_play == Play.ROCK
-            and self.player_two_play == Play.SCISSORS
-            or self.player_one_play == Play.PAPER
-            and self.player_two_play == Play.ROCK
-            or self.player_one_play == Play.SCISSORS
-            and self.player_two_play == Play.PAPER
+            player_one_play == Play.ROCK
+            and player_two_play == Play.SCISSORS
+            or player_one_play == Play.PAPER
+            and player_two_play == Play.ROCK
+            or player_one_play == Play.SCISSORS
+            and player_two_play == Play.PAPER
         ):
             return Player.PLAYER_ONE
         elif (
-            self.player_one_play == Play.ROCK
-            and self.player_two_play == Play.PAPER
-            or self.player_one_play == Play.PAPER
-            and self.player_two_play == Play.SCISSORS
-            or self.player_one_play == Play.SCISSORS
-            and self.player_two_play == Play.ROCK
+            player_one_play == Play.ROCK
+            and player_two_play == Play.PAPER
+            or player_one_play == Play.PAPER
+            and player_two_play == Play.SCISSORS
+            or player_one_play == Play.SCISSORS
+            and player_two_play == Play.ROCK
         ):
             return Player.PLAYER_TWO
         else:
             return None
 
+
+class Tournament:
+    def __init__(self, rounds: Iterable[Round]):
+        self.rounds = rounds
+
+    def __eq__(self, other):
+        if isinstance(other, Tournament):
+            return self.rounds == other.rounds
+        else:
+            return NotImplemented
+
     @property
-    def player_two_score(self) -> int:
-        return _play_score(self.player_two_play) + _outcome_score(
-            Player.PLAYER_TWO, self.winner
-        )
+    def rounds(self) -> tuple[Round, ...]:
+        return self._rounds
+
+    @rounds.setter
+    def rounds(self, rounds: Iterable[Round]):
+        self._rounds = tuple(rounds)
+        self._scores = None
+
+    @property
+    def scores(self) -> tuple[int, int]:
+        if self._scores is None:
+            kinds = Counter(self._rounds)
+            self._scores = (
+                sum(r.player_one_score * n for r, n in kinds.items()),
+                sum(r.player_two_score * n for r, n in kinds.items()),
+            )
+        return self._scores
 
     @property
     def player_one_score(self) -> int:
-        return _play_score(self.player_one_play) + _outcome_score(
-            Player.PLAYER_ONE, self.winner
-        )
+        return self.scores[0]
 
+    @property
+    def player_two_score(self) -> int:
+        return self.scores[1]
 
-class Tournament:
-    def __init__(self, rounds: list[Round]):
-        self.rounds = rounds
+
+SCORE_TABLE = {
+    (one, two): (Round(one, two).player_one_score, Round(one, two).player_two_score)
+    for one, two in product(Play, repeat=2)
+}
+
+
+class TournamentTally:
+    def __init__(self, counts: Counter[tuple[Play, Play]]):
+        self.counts = counts
 
     def __eq__(self, other):
-        if isinstance(other, Tournament):
-            return self.rounds == other.rounds
+        if isinstance(other, TournamentTally):
+            return self.counts == other.counts
         else:
             return NotImplemented
 
+    @staticmethod
+    def from_tournament(tournament: Tournament):
+        return TournamentTally(
+            Counter((r.player_one_play, r.player_two_play) for r in tournament.rounds)
+        )
+
     @property
     def player_one_score(self) -> int:
-        return sum([r.player_one_score for r in self.rounds])
+        return sum(SCORE_TABLE[kind][0] * n for kind, n in self.counts.items())
 
     @property
     def player_two_score(self) -> int:
-        return sum([r.player_two_score for r in self.rounds])
+        return sum(SCORE_TABLE[kind][1] * n for kind, n in self.counts.items())
 
 
+@profiled("parse")
 def load(data_file: Path, round_parser=Round.by_play_mapping):
     rounds = []
     with open(data_file) as tournament_data:
@@ -141,3 +213,61 @@ def load(data_file: Path, round_parser=Round.by_play_mapping):
             rounds.append(round_parser(line.strip()))
 
     return Tournament(rounds=rounds)
+
+
+def _tally(line_counts: Counter[str], round_parser) -> TournamentTally:
+    counts = Counter()
+    for round_data, n in line_counts.items():
+        if n > 0:
+            r = round_parser(round_data)
+            counts[r.player_one_play, r.player_two_play] += n
+
+    return TournamentTally(counts)
+
+
+@profiled("parse")
+def load_tally(data_file: Path, round_parser=Round.by_play_mapping):
+    with open(data_file) as tournament_data:
+        line_counts = Counter(line.strip() for line in tournament_data)
+
+    return _tally(line_counts, round_parser)
+
+
+def _read_chunks(data_file: Path, chunk_size: int, use_mmap: bool) -> Iterator[bytes]:
+    with open(data_file, "rb") as data:
+        size = os.fstat(data.fileno()).st_size
+        if use_mmap and size > 0:
+            with mmap(data.fileno(), 0, access=ACCESS_READ) as mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    yield mapped[start : start + chunk_size]
+        else:
+            while chunk := data.read(min(chunk_size, size + 1)):
+                yield chunk
+
+
+@profiled("parse")
+def load_tallies(
+    data_file: Path, use_mmap: bool = False, chunk_size: int = 2**24
+) -> tuple[TournamentTally, TournamentTally]:
+    patterns = {round_data.encode(): round_data for round_data in PLAY_MAP}
+    line_counts = Counter()
+    carry = b""
+    for chunk in _read_chunks(data_file, chunk_size, use_mmap):
+        chunk = carry + chunk
+        for pattern, round_data in patterns.items():
+            line_counts[round_data] += chunk.count(pattern)
+        carry = chunk[-2:]
+
+    return (
+        _tally(line_counts, Round.by_play_mapping),
+        _tally(line_counts, Round.by_outcome_mapping),
+    )
+
+
+SOLUTION = Solution(
+    load=load_tallies,
+    parts={
+        "part_one": lambda tournaments: tournaments[0].player_two_score,
+        "part_two": lambda tournaments: tournaments[1].player_two_score,
+    },
+)
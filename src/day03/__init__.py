@@ -1,7 +1,25 @@
-from functools import cache
+import os
+import re
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache, cached_property, reduce
+from itertools import islice
+from mmap import ACCESS_READ, mmap
+from operator import and_
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
 
+from src import Line, Solution, profiled
 
+if TYPE_CHECKING:
+    import numpy
+
+ITEM_TYPES = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@profiled("parse")
 def load(data_file: Path):
     rucksacks = []
     with open(data_file) as rucksacks_data:
@@ -22,7 +40,26 @@ def load(data_file: Path):
 
 @cache
 def get_priority(type):
-    return "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ".find(type) + 1
+    return ITEM_TYPES.find(type) + 1
+
+
+_TYPE_BITS = [
+    1 << ITEM_TYPES.index(chr(code)) if chr(code) in ITEM_TYPES else 0
+    for code in range(256)
+]
+
+
+def item_mask(types: Line) -> int:
+    mask = 0
+    for code in set(types.encode() if isinstance(types, str) else types):
+        mask |= _TYPE_BITS[code]
+    return mask
+
+
+def item_from_mask(mask: int) -> "Item":
+    if mask == 0:
+        raise ValueError("mask has no item types")
+    return Item(ITEM_TYPES[mask.bit_length() - 1])
 
 
 class Item:
@@ -57,6 +94,10 @@ class Compartment:
     def from_str(type_data: str):
         return Compartment(items=[Item(t) for t in type_data])
 
+    @cached_property
+    def mask(self) -> int:
+        return item_mask("".join(i.type for i in self.items))
+
 
 class Rucksack:
     def __init__(self, compartments: tuple[Compartment, Compartment]):
@@ -80,28 +121,234 @@ class Rucksack:
     def items(self):
         return self.first_compartment.items + self.second_compartment.items
 
+    @property
+    def mask(self) -> int:
+        return self.first_compartment.mask | self.second_compartment.mask
 
-def get_unsorted_item(rucksack: Rucksack):
-    return next(
-        iter(
-            set(rucksack.first_compartment.items).intersection(
-                set(rucksack.second_compartment.items)
+
+_LINES = re.compile(rb"[^\n]+")
+
+
+class RucksackManifest(Sequence[Rucksack]):
+    def __init__(self, buffer: memoryview, starts: array, ends: array):
+        self.buffer = buffer
+        self.starts = starts
+        self.ends = ends
+
+    @staticmethod
+    def from_buffer(buffer: memoryview) -> "RucksackManifest":
+        starts, ends = array("q"), array("q")
+        for line in _LINES.finditer(buffer):
+            start, end = line.span()
+            while end > start and buffer[end - 1] in b" \t\r":
+                end -= 1
+            if end > start:
+                starts.append(start)
+                ends.append(end)
+
+        return RucksackManifest(buffer, starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: int) -> Rucksack:
+        return Rucksack(
+            tuple(
+                Compartment.from_str(str(compartment, "ascii"))
+                for compartment in self.compartments(index)
             )
         )
+
+    def compartments(self, index: int) -> tuple[memoryview, memoryview]:
+        start, end = self.starts[index], self.ends[index]
+        middle = start + (end - start) // 2
+        return self.buffer[start:middle], self.buffer[middle:end]
+
+    def masks(self) -> Iterator[tuple[int, int]]:
+        for index in range(len(self)):
+            first, second = self.compartments(index)
+            yield item_mask(first), item_mask(second)
+
+
+@profiled("parse")
+def map_manifest(data_file: Path) -> RucksackManifest:
+    with open(data_file, "rb") as rucksacks_data:
+        if os.fstat(rucksacks_data.fileno()).st_size == 0:
+            return RucksackManifest(memoryview(b""), array("q"), array("q"))
+        mapped = mmap(rucksacks_data.fileno(), 0, access=ACCESS_READ)
+
+    return RucksackManifest.from_buffer(memoryview(mapped))
+
+
+def get_unsorted_item(rucksack: Rucksack):
+    return item_from_mask(
+        rucksack.first_compartment.mask & rucksack.second_compartment.mask
     )
 
 
+@profiled("solve")
 def get_badges(rucksacks: list[Rucksack]) -> list[Item]:
-    badges = []
-    for i in range(0, len(rucksacks), 3):
-        badges.append(
-            next(
-                iter(
-                    set(rucksacks[i].items).intersection(
-                        set(rucksacks[i + 1].items), set(rucksacks[i + 2].items)
-                    )
-                )
-            )
+    return [*find_badges(rucksacks)]
+
+
+def _rucksack_mask(rucksack: Rucksack | Line) -> int:
+    return rucksack.mask if isinstance(rucksack, Rucksack) else item_mask(rucksack)
+
+
+def _badge_masks(groups: list[list[Rucksack | Line]]) -> list[int]:
+    return [reduce(and_, map(_rucksack_mask, group)) for group in groups]
+
+
+def _groups(
+    rucksacks: Iterable[Rucksack | Line], group_size: int
+) -> Iterator[list[Rucksack | Line]]:
+    rucksacks = iter(rucksacks)
+    while group := [*islice(rucksacks, group_size)]:
+        if len(group) < group_size:
+            raise ValueError(f"last group has {len(group)} of {group_size} rucksacks")
+        yield group
+
+
+def _pooled_badge_masks(
+    groups: Iterator[list[Rucksack | Line]], processes: int, batch_size: int
+) -> Iterator[int]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        while batch := [*islice(groups, batch_size)]:
+            batch = [
+                [bytes(r) if isinstance(r, memoryview) else r for r in group]
+                for group in batch
+            ]
+            pending.append(executor.submit(_badge_masks, batch))
+            if len(pending) > 2 * processes:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def find_badges(
+    rucksacks: Iterable[Rucksack | Line],
+    group_size: int = 3,
+    processes: int | None = None,
+    batch_size: int = 1024,
+) -> Iterator[Item]:
+    groups = _groups(rucksacks, group_size)
+    if processes is None:
+        masks = (reduce(and_, map(_rucksack_mask, group)) for group in groups)
+    else:
+        masks = _pooled_badge_masks(groups, processes, batch_size)
+
+    for mask in masks:
+        yield item_from_mask(mask)
+
+
+def get_badge_masks(rucksack_masks: Iterable[int]) -> list[int]:
+    masks = [*rucksack_masks]
+    return [reduce(and_, masks[i : i + 3]) for i in range(0, len(masks), 3)]
+
+
+@profiled("parse")
+def load_masks(data_file: Path) -> list[tuple[int, int]]:
+    masks = []
+    with open(data_file, "rb") as rucksacks_data:
+        for line in rucksacks_data:
+            item_types = line.strip()
+            half = len(item_types) // 2
+            masks.append((item_mask(item_types[:half]), item_mask(item_types[half:])))
+
+    return masks
+
+
+def unsorted_priority_total(masks: Iterable[tuple[int, int]]) -> int:
+    return sum((first & second).bit_length() for first, second in masks)
+
+
+def badge_priority_total(masks: Iterable[tuple[int, int]]) -> int:
+    badge_masks = get_badge_masks(first | second for first, second in masks)
+    return sum(mask.bit_length() for mask in badge_masks)
+
+
+@dataclass(frozen=True)
+class PriorityAggregates:
+    unsorted_priorities: "numpy.ndarray"
+    badge_priorities: "numpy.ndarray"
+
+    @property
+    def unsorted_total(self) -> int:
+        return int(self.unsorted_priorities.sum())
+
+    @property
+    def badge_total(self) -> int:
+        return int(self.badge_priorities.sum())
+
+    @property
+    def unsorted_histogram(self) -> "numpy.ndarray":
+        return self._histogram(self.unsorted_priorities)
+
+    @property
+    def badge_histogram(self) -> "numpy.ndarray":
+        return self._histogram(self.badge_priorities)
+
+    @staticmethod
+    def _histogram(priorities: "numpy.ndarray") -> "numpy.ndarray":
+        import numpy
+
+        return numpy.bincount(priorities, minlength=len(ITEM_TYPES) + 1)
+
+
+def _bit_lengths(masks: "numpy.ndarray") -> "numpy.ndarray":
+    import numpy
+
+    return numpy.frexp(masks.astype(numpy.float64))[1].astype(numpy.int64)
+
+
+def priority_aggregates(data: bytes, group_size: int = 3) -> PriorityAggregates:
+    import numpy
+
+    type_bits = numpy.array(_TYPE_BITS, dtype=numpy.uint64)
+    codes = numpy.frombuffer(data, dtype=numpy.uint8)
+    empty = PriorityAggregates(*numpy.zeros((2, 0), dtype=numpy.int64))
+    if len(codes) == 0:
+        return empty
+
+    newlines = numpy.flatnonzero(codes == ord("\n"))
+    starts = numpy.concatenate(([0], newlines + 1))
+    ends = numpy.concatenate((newlines, [len(codes)]))
+    ends -= (ends > starts) & (codes[ends - 1] == ord("\r"))
+    starts, ends = starts[ends > starts], ends[ends > starts]
+    if len(starts) % group_size != 0:
+        raise ValueError(
+            f"last group has {len(starts) % group_size} of {group_size} rucksacks"
         )
+    if len(starts) == 0:
+        return empty
+    middles = starts + (ends - starts) // 2
+    boundaries = numpy.empty(2 * len(starts), dtype=numpy.intp)
+    boundaries[0::2] = starts
+    boundaries[1::2] = middles
+    compartments = numpy.bitwise_or.reduceat(type_bits[codes], boundaries)
+    first, second = compartments[0::2], compartments[1::2]
+    first[middles == starts] = 0
+    badges = numpy.bitwise_and.reduce((first | second).reshape(-1, group_size), axis=1)
+
+    return PriorityAggregates(_bit_lengths(first & second), _bit_lengths(badges))
+
+
+@profiled("parse")
+def load_priority_aggregates(
+    data_file: Path, group_size: int = 3
+) -> PriorityAggregates:
+    with open(data_file, "rb") as rucksacks_data:
+        return priority_aggregates(rucksacks_data.read(), group_size)
+
 
-    return badges
+SOLUTION = Solution(
+    load=load_masks,
+    parts={
+        "part_one": unsorted_priority_total,
+        "part_two": badge_priority_total,
+    },
+)
@@ -1,7 +1,18 @@
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Self
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Self
 
+from src import Solution, profiled
 
+if TYPE_CHECKING:
+    import numpy
+
+
+@profiled("parse")
 def load(data_file: Path):
     assignment_pairs = []
     with open(data_file) as data:
@@ -14,6 +25,10 @@ def load(data_file: Path):
 
 SectionID = int
 
+Columns = tuple[array, array, array, array]
+
+_SEPARATORS = bytes.maketrans(b",-", b"  ")
+
 
 class Assignment:
     def __init__(self, low: SectionID, high: SectionID):
@@ -41,3 +56,234 @@ class Assignment:
     @staticmethod
     def from_str(data: str):
         return Assignment(*[int(id) for id in data.split("-")])
+
+
+@dataclass
+class _IntervalNode:
+    center: SectionID
+    by_low: list[Assignment]
+    by_high: list[Assignment]
+    left: Optional["_IntervalNode"] = None
+    right: Optional["_IntervalNode"] = None
+    lows: list[SectionID] = field(init=False, repr=False)
+    negated_highs: list[SectionID] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.lows = [a.low for a in self.by_low]
+        self.negated_highs = [-a.high for a in self.by_high]
+
+    @staticmethod
+    def build(assignments: list[Assignment]) -> Optional["_IntervalNode"]:
+        if not assignments:
+            return None
+
+        endpoints = sorted(e for a in assignments for e in (a.low, a.high))
+        center = endpoints[len(endpoints) // 2]
+        left = [a for a in assignments if a.high < center]
+        right = [a for a in assignments if a.low > center]
+        here = [a for a in assignments if a.low <= center <= a.high]
+        return _IntervalNode(
+            center,
+            sorted(here, key=lambda a: a.low),
+            sorted(here, key=lambda a: -a.high),
+            _IntervalNode.build(left),
+            _IntervalNode.build(right),
+        )
+
+
+class AssignmentIndex:
+    def __init__(self, assignments: Iterable[Assignment]):
+        self.assignments = [*assignments]
+        self._root = _IntervalNode.build(self.assignments)
+        self._lows = sorted(a.low for a in self.assignments)
+        self._highs = sorted(a.high for a in self.assignments)
+
+    def __len__(self) -> int:
+        return len(self.assignments)
+
+    @staticmethod
+    def from_pairs(pairs: Iterable[tuple[Assignment, Assignment]]):
+        return AssignmentIndex(a for pair in pairs for a in pair)
+
+    def stab(self, section_id: SectionID) -> list[Assignment]:
+        return self.overlapping(Assignment(section_id, section_id))
+
+    def overlapping(self, query: Assignment) -> list[Assignment]:
+        found = []
+        node = self._root
+        pending = []
+        while node is not None or pending:
+            if node is None:
+                node = pending.pop()
+            if query.high < node.center:
+                found.extend(node.by_low[: bisect_right(node.lows, query.high)])
+                node = node.left
+            elif query.low > node.center:
+                found.extend(
+                    node.by_high[: bisect_right(node.negated_highs, -query.low)]
+                )
+                node = node.right
+            else:
+                found.extend(node.by_low)
+                if node.right is not None:
+                    pending.append(node.right)
+                node = node.left
+
+        return found
+
+    def overlapping_any(self, queries: Iterable[Assignment]) -> list[Assignment]:
+        found = {}
+        for query in queries:
+            for assignment in self.overlapping(query):
+                found.setdefault(id(assignment), assignment)
+
+        return [*found.values()]
+
+    def coverage(self, section_id: SectionID) -> int:
+        return bisect_right(self._lows, section_id) - bisect_left(
+            self._highs, section_id
+        )
+
+    def coverage_counts(self, low: SectionID, high: SectionID) -> list[int]:
+        return [self.coverage(section_id) for section_id in range(low, high + 1)]
+
+
+@dataclass(frozen=True)
+class AssignmentPairs:
+    first_low: "numpy.ndarray"
+    first_high: "numpy.ndarray"
+    second_low: "numpy.ndarray"
+    second_high: "numpy.ndarray"
+
+    @staticmethod
+    def from_pairs(pairs: Iterable[tuple[Assignment, Assignment]]) -> "AssignmentPairs":
+        import numpy
+
+        bounds = numpy.array(
+            [(a.low, a.high, b.low, b.high) for a, b in pairs], dtype=numpy.int64
+        ).reshape(-1, 4)
+        return AssignmentPairs(*bounds.T)
+
+    @staticmethod
+    def from_columns(columns: Columns) -> "AssignmentPairs":
+        import numpy
+
+        return AssignmentPairs(
+            *(numpy.frombuffer(column, dtype=numpy.int64) for column in columns)
+        )
+
+    def __len__(self) -> int:
+        return len(self.first_low)
+
+    def __getitem__(self, index: int) -> tuple[Assignment, Assignment]:
+        return (
+            Assignment(int(self.first_low[index]), int(self.first_high[index])),
+            Assignment(int(self.second_low[index]), int(self.second_high[index])),
+        )
+
+    @property
+    def containment(self) -> "numpy.ndarray":
+        return (
+            (self.first_low <= self.second_low) & (self.second_high <= self.first_high)
+        ) | (
+            (self.second_low <= self.first_low) & (self.first_high <= self.second_high)
+        )
+
+    @property
+    def overlap_lengths(self) -> "numpy.ndarray":
+        import numpy
+
+        lows = numpy.maximum(self.first_low, self.second_low)
+        highs = numpy.minimum(self.first_high, self.second_high)
+        return numpy.clip(highs - lows + 1, 0, None)
+
+    @property
+    def overlaps(self) -> "numpy.ndarray":
+        return self.overlap_lengths > 0
+
+    def containment_count(self) -> int:
+        return int(self.containment.sum())
+
+    def overlap_count(self) -> int:
+        return int(self.overlaps.sum())
+
+
+@profiled("parse")
+def load_pairs(data_file: Path) -> AssignmentPairs:
+    import numpy
+
+    with open(data_file, "rb") as data:
+        text = data.read().translate(_SEPARATORS)
+
+    bounds = numpy.fromstring(text, dtype=numpy.int64, sep=" ")
+    if len(bounds) % 4 != 0:
+        raise ValueError(f"expected four section IDs per line in {data_file}")
+
+    return AssignmentPairs(*bounds.reshape(-1, 4).T)
+
+
+def _extend_columns(columns: Columns, data: bytes) -> None:
+    bounds = data.translate(_SEPARATORS).split()
+    if len(bounds) % 4 != 0:
+        raise ValueError(f"expected four section IDs per line, got {len(bounds)} IDs")
+
+    for offset, column in enumerate(columns):
+        column.extend(map(int, bounds[offset::4]))
+
+
+def parse_columns(data: bytes) -> Columns:
+    columns = array("q"), array("q"), array("q"), array("q")
+    _extend_columns(columns, data)
+    return columns
+
+
+def _line_chunks(data_file: Path, chunk_size: int) -> Iterator[bytes]:
+    carry = b""
+    with open(data_file, "rb") as data:
+        size = os.fstat(data.fileno()).st_size
+        while chunk := data.read(min(chunk_size, size + 1)):
+            chunk = carry + chunk
+            end = chunk.rfind(b"\n") + 1
+            carry = chunk[end:]
+            yield chunk[:end]
+
+    yield carry
+
+
+@profiled("parse")
+def load_columns(data_file: Path, chunk_size: int = 2**20) -> Columns:
+    columns = array("q"), array("q"), array("q"), array("q")
+    for chunk in _line_chunks(data_file, chunk_size):
+        _extend_columns(columns, chunk)
+
+    return columns
+
+
+def iter_bounds(
+    data_file: Path, chunk_size: int = 2**20
+) -> Iterator[tuple[SectionID, SectionID, SectionID, SectionID]]:
+    for chunk in _line_chunks(data_file, chunk_size):
+        yield from zip(*parse_columns(chunk))
+
+
+def count_containments(columns: Columns) -> int:
+    return sum(a <= c and d <= b or c <= a and b <= d for a, b, c, d in zip(*columns))
+
+
+def count_overlaps(columns: Columns) -> int:
+    return sum(max(a, c) <= min(b, d) for a, b, c, d in zip(*columns))
+
+
+SOLUTION = Solution(
+    load=load_columns,
+    parts={
+        "part_one": count_containments,
+        "part_two": count_overlaps,
+    },
+)
+
+LOADERS = {
+    "load": load,
+    "load_columns": load_columns,
+    "iter_bounds": lambda data_file: deque(iter_bounds(data_file), maxlen=0),
+}
@@ -1,9 +1,10 @@
 from enum import Enum
 from itertools import zip_longest
+from random import random
 from re import match
-from typing import Self
+from typing import Iterable, Iterator, Optional, Self
 
-from src import load_data
+from src import Line, Solution, load_data, profiled, stream_data, text_lines
 
 
 class Crate:
@@ -17,11 +18,130 @@ class Crate:
             return NotImplemented
 
 
+class _RopeNode:
+    __slots__ = ("crate", "priority", "size", "left", "right", "flipped")
+
+    def __init__(self, crate: Crate):
+        self.crate = crate
+        self.priority = random()
+        self.size = 1
+        self.left: Optional[_RopeNode] = None
+        self.right: Optional[_RopeNode] = None
+        self.flipped = False
+
+    def push(self):
+        if self.flipped:
+            self.left, self.right = self.right, self.left
+            for child in (self.left, self.right):
+                if child is not None:
+                    child.flipped = not child.flipped
+            self.flipped = False
+
+    def update(self):
+        self.size = 1 + _size(self.left) + _size(self.right)
+
+
+def _size(node: Optional[_RopeNode]) -> int:
+    return 0 if node is None else node.size
+
+
+def _split(
+    node: Optional[_RopeNode], k: int
+) -> tuple[Optional[_RopeNode], Optional[_RopeNode]]:
+    if node is None:
+        return None, None
+
+    node.push()
+    if _size(node.left) < k:
+        node.right, rest = _split(node.right, k - _size(node.left) - 1)
+        node.update()
+        return node, rest
+    else:
+        first, node.left = _split(node.left, k)
+        node.update()
+        return first, node
+
+
+def _merge(
+    first: Optional[_RopeNode], second: Optional[_RopeNode]
+) -> Optional[_RopeNode]:
+    if first is None or second is None:
+        return first or second
+
+    if first.priority > second.priority:
+        first.push()
+        first.right = _merge(first.right, second)
+        first.update()
+        return first
+    else:
+        second.push()
+        second.left = _merge(first, second.left)
+        second.update()
+        return second
+
+
+class CrateRope:
+    def __init__(self, crates: Iterable[Crate] = (), root: Optional[_RopeNode] = None):
+        spine: list[_RopeNode] = []
+        for crate in crates:
+            node = _RopeNode(crate)
+            last = None
+            while spine and spine[-1].priority < node.priority:
+                last = spine.pop()
+                last.update()
+            node.left = last
+            if spine:
+                spine[-1].right = node
+            spine.append(node)
+        while spine:
+            root = spine.pop()
+            root.update()
+
+        self._root = root
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __iter__(self) -> Iterator[Crate]:
+        path: list[_RopeNode] = []
+        node = self._root
+        while path or node is not None:
+            if node is not None:
+                node.push()
+                path.append(node)
+                node = node.left
+            else:
+                node = path.pop()
+                yield node.crate
+                node = node.right
+
+    @property
+    def top(self) -> Optional[Crate]:
+        node = self._root
+        while node is not None:
+            node.push()
+            if node.right is None:
+                return node.crate
+            node = node.right
+
+    def take(self, n: int) -> "CrateRope":
+        self._root, taken = _split(self._root, len(self) - n)
+        return CrateRope(root=taken)
+
+    def put(self, other: "CrateRope"):
+        self._root = _merge(self._root, other._root)
+        other._root = None
+
+    def reverse(self):
+        if self._root is not None:
+            self._root.flipped = not self._root.flipped
+
+
 StackLabel = str
 
 
 class Stack:
-    def __init__(self, label: StackLabel, crates: list[Crate]):
+    def __init__(self, label: StackLabel, crates: Iterable[Crate]):
         self.label = label
         self.crates = crates
 
@@ -31,6 +151,24 @@ class Stack:
         else:
             return NotImplemented
 
+    def __getstate__(self):
+        return {"label": self.label, "crates": self.crates}
+
+    def __setstate__(self, state):
+        self.__init__(state["label"], state["crates"])
+
+    @property
+    def crates(self) -> tuple[Crate, ...]:
+        return tuple(self.rope)
+
+    @crates.setter
+    def crates(self, crates: Iterable[Crate]):
+        self.rope = CrateRope(crates)
+
+    @property
+    def top(self) -> Optional[Crate]:
+        return self.rope.top
+
 
 class Step:
     def __init__(self, crate_count: int, start: StackLabel, end: StackLabel):
@@ -73,23 +211,19 @@ class Ship:
     def stacks(self):
         return list(self._stacks.values())
 
+    @profiled("solve")
     def run_crane(self, steps: list[Step], strategy=Strategy.CRATE_MOVER_9000):
         for step in steps:
-            start_crates = self._stacks[step.start].crates
-            end_crates = self._stacks[step.end].crates
-            n = step.crate_count
-            crates = start_crates[-n:]
-            del start_crates[-n:]
-            match strategy:
-                case Strategy.CRATE_MOVER_9000:
-                    end_crates.extend(reversed(crates))
-                case Strategy.CRATE_MOVER_9001:
-                    end_crates.extend(crates)
-
-
-def parse(data: list[str]) -> tuple[Ship, list[Step]]:
+            crates = self._stacks[step.start].rope.take(step.crate_count)
+            if strategy == Strategy.CRATE_MOVER_9000:
+                crates.reverse()
+            self._stacks[step.end].rope.put(crates)
+
+
+@profiled("parse")
+def parse(data: Iterable[Line]) -> tuple[Ship, list[Step]]:
     stack_row_data = []
-    data_iter = iter(data)
+    data_iter = text_lines(data)
 
     for line in data_iter:
         if line.isspace():
@@ -112,4 +246,18 @@ def parse(data: list[str]) -> tuple[Ship, list[Step]]:
 
 
 def load(data_file: str) -> tuple[Ship, list[Step]]:
-    return parse(load_data(data_file))
+    return parse(stream_data(data_file))
+
+
+def top_crates(ship: Ship, steps: list[Step], strategy: Strategy) -> str:
+    ship.run_crane(steps, strategy=strategy)
+    return "".join(top.label for stack in ship.stacks if (top := stack.top) is not None)
+
+
+SOLUTION = Solution(
+    load=load,
+    parts={
+        "part_one": lambda data: top_crates(*data, Strategy.CRATE_MOVER_9000),
+        "part_two": lambda data: top_crates(*data, Strategy.CRATE_MOVER_9001),
+    },
+)
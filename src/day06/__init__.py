@@ -1,5 +1,8 @@
+from pathlib import Path
 from re import match
 
+from src import Solution, profiled
+
 
 class DatastreamBuffer:
     def __init__(self, data_stream: str):
@@ -11,6 +14,7 @@ class DatastreamBuffer:
         else:
             return NotImplemented
 
+    @profiled("solve")
     def _find_marker(self, marker_length: int):
         for i in range(marker_length, len(self.data_stream)):
             unique_chars = set()
@@ -31,5 +35,15 @@ class DatastreamBuffer:
         return self._find_marker(14)
 
 
+@profiled("parse")
 def parse(data: str) -> DatastreamBuffer:
     return DatastreamBuffer(data.strip())
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(Path(data_file).read_text()),
+    parts={
+        "part_one": lambda buffer: buffer.first_start_of_packet_marker,
+        "part_two": lambda buffer: buffer.first_start_of_message_marker,
+    },
+)
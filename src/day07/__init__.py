@@ -1,7 +1,9 @@
 import re
 from dataclasses import dataclass
 from itertools import chain
-from typing import Callable, Iterator, Self, TypedDict
+from typing import Callable, Iterable, Iterator, Self, TypedDict
+
+from src import Line, Solution, profiled, stream_data, text_lines
 
 
 class DirectoryArgData(TypedDict):
@@ -10,8 +12,9 @@ class DirectoryArgData(TypedDict):
     files_lines: list[str]
 
 
-def parse(data: list[str]):
-    data_iter = iter(data)
+@profiled("parse")
+def parse(data: Iterable[Line]):
+    data_iter = text_lines(data)
     root_dir_name = re.match(r"\$ cd (.+)", next(data_iter).strip()).group(1)
 
     return Directory.from_data(root_dir_name, data_iter)
@@ -67,3 +70,23 @@ def find_directories(
         filter(condition, [directory]),
         *(find_directories(subdir, condition) for subdir in directory.directories),
     )
+
+
+def smallest_directory_to_delete(
+    root: Directory, total_disk_space=70000000, required_unused_disk_space=30000000
+) -> int:
+    required_disk_space = required_unused_disk_space - (total_disk_space - root.size)
+    return min(
+        d.size for d in find_directories(root, lambda d: d.size >= required_disk_space)
+    )
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(stream_data(data_file)),
+    parts={
+        "part_one": lambda root: sum(
+            d.size for d in find_directories(root, lambda d: d.size <= 100000)
+        ),
+        "part_two": smallest_directory_to_delete,
+    },
+)
@@ -1,9 +1,9 @@
-from dataclasses import InitVar, dataclass, field
+from dataclasses import InitVar, dataclass
 from enum import Enum
-from functools import cached_property
-from itertools import zip_longest
 from math import prod
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
+
+from src import Grid, Line, Solution, profiled, stream_data, text_lines
 
 
 class Direction(Enum):
@@ -42,68 +42,108 @@ def takeuntil(predicate, iterable):
         yield x
 
 
+def get_visible_indices(heights: Iterable[int]) -> Iterator[int]:
+    tallest_so_far = -1
+    for index, height in enumerate(heights):
+        if height > tallest_so_far:
+            tallest_so_far = height
+            yield index
+
+
 @dataclass(frozen=True)
 class Forest:
-    trees: InitVar[list[list[Tree]]]
-    rows: list[list[Tree]] = field(init=False)
-
-    def __post_init__(self, trees: list[list[Tree]]):
-        object.__setattr__(
-            self,
-            "rows",
-            [
-                [
-                    Tree(trees[i][j].height, location=(i, j))
-                    for j in range(0, len(trees[i]))
-                ]
-                for i in range(0, len(trees))
-            ],
-        )
+    trees: InitVar[Optional[list[list[Tree]]]] = None
+    heights: Optional[Grid] = None
+
+    @profiled("build")
+    def __post_init__(self, trees: Optional[list[list[Tree]]]):
+        if trees is not None:
+            object.__setattr__(
+                self,
+                "heights",
+                Grid.from_rows([t.height for t in row] for row in trees),
+            )
+
+    def tree_at(self, location: tuple[int, int]) -> Tree:
+        return Tree(self.heights[location], location=location)
+
+    @property
+    def rows(self) -> list[list[Tree]]:
+        return [
+            [self.tree_at((r, c)) for c in range(self.heights.width)]
+            for r in range(self.heights.height)
+        ]
 
+    @property
+    def columns(self) -> list[list[Tree]]:
+        return [
+            [self.tree_at((r, c)) for r in range(self.heights.height)]
+            for c in range(self.heights.width)
+        ]
+
+    @profiled("solve")
     def get_visible_trees(
         self, from_directions: set[Direction] = frozenset(iter(Direction))
     ) -> set[Tree]:
-        visible_trees = set()
-
-        if Direction.NORTH in from_directions:
-            for column in self.columns:
-                visible_trees |= get_visible_trees(c for c in column if c is not None)
-        if Direction.SOUTH in from_directions:
-            for column in zip_longest(*reversed(self.rows)):
-                visible_trees |= get_visible_trees(c for c in column if c is not None)
-        if Direction.EAST in from_directions:
-            for row in self.rows:
-                visible_trees |= get_visible_trees(iter(row))
-        if Direction.WEST in from_directions:
-            for row in self.rows:
-                visible_trees |= get_visible_trees(reversed(row))
-
-        return visible_trees
-
-    @cached_property
-    def columns(self):
-        return [*zip_longest(*self.rows)]
+        visible_locations = set()
+        last_row, last_column = self.heights.height - 1, self.heights.width - 1
+
+        for c in range(self.heights.width):
+            column = self.heights.column(c)
+            if Direction.NORTH in from_directions:
+                visible_locations.update((r, c) for r in get_visible_indices(column))
+            if Direction.SOUTH in from_directions:
+                visible_locations.update(
+                    (last_row - r, c) for r in get_visible_indices(column[::-1])
+                )
+        for r in range(self.heights.height):
+            row = self.heights.row(r)
+            if Direction.EAST in from_directions:
+                visible_locations.update((r, c) for c in get_visible_indices(row))
+            if Direction.WEST in from_directions:
+                visible_locations.update(
+                    (r, last_column - c) for c in get_visible_indices(row[::-1])
+                )
+
+        return set(map(self.tree_at, visible_locations))
 
     def get_scenic_score_by_location(self, location: tuple[int, int]):
         r, c = location
-        trees_to_the_north = self.columns[c][r::-1][1:]
-        trees_to_the_south = self.columns[c][r:][1:]
-        trees_to_the_east = self.rows[r][c:][1:]
-        trees_to_the_west = self.rows[r][c::-1][1:]
+        height = self.heights[location]
+        row, column = self.heights.row(r), self.heights.column(c)
+        heights_to_the_north = column[r::-1][1:]
+        heights_to_the_south = column[r:][1:]
+        heights_to_the_east = row[c:][1:]
+        heights_to_the_west = row[c::-1][1:]
         return prod(
             map(
-                lambda arr: len(
-                    [*takeuntil(lambda t: t.height >= self.rows[r][c].height, arr)]
-                ),
+                lambda arr: len([*takeuntil(lambda h: h >= height, arr)]),
                 [
-                    trees_to_the_north,
-                    trees_to_the_south,
-                    trees_to_the_east,
-                    trees_to_the_west,
+                    heights_to_the_north,
+                    heights_to_the_south,
+                    heights_to_the_east,
+                    heights_to_the_west,
                 ],
             )
         )
 
 
-def parse(data: list[str]):
-    return Forest([[Tree(int(h)) for h in line.strip()] for line in data])
+@profiled("parse")
+def parse(data: Iterable[Line]):
+    return Forest(
+        heights=Grid.from_rows(
+            [int(h) for h in line.strip()] for line in text_lines(data)
+        )
+    )
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(stream_data(data_file)),
+    parts={
+        "part_one": lambda forest: len(forest.get_visible_trees()),
+        "part_two": lambda forest: max(
+            forest.get_scenic_score_by_location(location)
+            for location in forest.heights.positions()
+        ),
+    },
+)
@@ -1,7 +1,9 @@
 from dataclasses import InitVar, dataclass, field
 from enum import Enum
 from re import match
-from typing import Iterator, Optional, Self
+from typing import Iterable, Iterator, Optional, Self
+
+from src import Line, Solution, profiled, stream_data, text_lines
 
 
 class Direction(Enum):
@@ -114,6 +116,7 @@ def link(segments: list[Segment]) -> list[Segment]:
     return segments
 
 
+@profiled("solve")
 def record_tail_positions(rope: Rope, moves: Iterator[Move]) -> set[tuple[int, int]]:
     visited_positions = set([])
     tail = rope.tail
@@ -124,8 +127,20 @@ def record_tail_positions(rope: Rope, moves: Iterator[Move]) -> set[tuple[int, i
     return visited_positions
 
 
-def parse(data: list[str]) -> Iterator[Move]:
-    for line in data:
+@profiled("parse")
+def parse(data: Iterable[Line]) -> Iterator[Move]:
+    for line in text_lines(data):
         where, how_many = match(r"([UDLR]) (\d+)", line).group(1, 2)
         for _ in range(int(how_many)):
             yield Move(Direction.from_str(where))
+
+
+SOLUTION = Solution(
+    load=lambda data_file: [*parse(stream_data(data_file))],
+    parts={
+        "part_one": lambda moves: len(record_tail_positions(Rope(), iter(moves))),
+        "part_two": lambda moves: len(
+            record_tail_positions(Rope(num_segments=10), iter(moves))
+        ),
+    },
+)
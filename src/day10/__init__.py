@@ -2,9 +2,9 @@ import re
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Iterator, Self, TypedDict
+from typing import Iterable, Iterator, Self, TypedDict
 
-from src import Receiver
+from src import Line, Receiver, Solution, count, profiled, stream_data, text_lines
 
 
 class Keyword(Enum):
@@ -60,12 +60,17 @@ class CPU:
     cycle_number: int = 0
     receivers: dict[str, Receiver[CPUState]] = field(default_factory=dict)
 
+    @profiled("solve")
     def run(self, program: Program):
-        for instruction in program.instructions:
-            for _ in range(0, self.get_execution_cycles(instruction)):
-                self.tick()
+        start = self.cycle_number
+        try:
+            for instruction in program.instructions:
+                for _ in range(0, self.get_execution_cycles(instruction)):
+                    self.tick()
 
-            instruction.execute(self.X)
+                instruction.execute(self.X)
+        finally:
+            count("day10.CPU.ticks", self.cycle_number - start)
 
     def tick(self):
         self.cycle_number += 1
@@ -149,5 +154,37 @@ class Addx(Instruction):
         pass
 
 
-def parse(data: list[str]) -> list[Instruction]:
-    return [Instruction.from_str(d.strip()) for d in data]
+@profiled("parse")
+def parse(data: Iterable[Line]) -> list[Instruction]:
+    return [Instruction.from_str(d.strip()) for d in text_lines(data)]
+
+
+@dataclass
+class SignalStrengthMeter:
+    total: int = 0
+
+    def receive(self, cpu_state: CPUState):
+        if cpu_state["cycle_number"] % 40 == 20:
+            self.total += cpu_state["cycle_number"] * cpu_state["X"]["value"]
+
+
+def signal_strength(instructions: list[Instruction]) -> int:
+    meter = SignalStrengthMeter()
+    CPU(receivers={"meter": meter}).run(Program(iter(instructions)))
+    return meter.total
+
+
+def render(instructions: list[Instruction]) -> list[str]:
+    cycle_count = sum(map(CPU.get_execution_cycles, instructions))
+    device = Device(crt=CRT(height=max(1, -(-cycle_count // CRT.width))))
+    device.run(Program(iter(instructions)))
+    return device.crt.render()
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(stream_data(data_file)),
+    parts={
+        "part_one": signal_strength,
+        "part_two": lambda instructions: "\n".join(render(instructions)),
+    },
+)
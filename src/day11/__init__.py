@@ -4,9 +4,10 @@ from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterator, Optional, Self
+from math import prod
+from typing import Iterable, Iterator, Optional, Self
 
-import yaml
+from src import Line, Solution, count, profiled, stream_data, text_lines
 
 
 @dataclass
@@ -114,9 +115,13 @@ class Monkey:
     game: Optional["KeepAway"] = field(compare=False, repr=False, default=None)
 
     def throw_items(self):
+        throws = 0
         while len(self.items) > 0:
+            throws += 1
             self.throw_next_item()
 
+        count("day11.Monkey.throws", throws)
+
     def throw_next_item(self):
         item = self.items.pop(0)
         self.update(item)
@@ -153,6 +158,7 @@ class KeepAway:
             monkey.game = self
             pass
 
+    @profiled("solve")
     def play(self, num_rounds=1):
         for _ in range(num_rounds):
             for monkey in self.players.values():
@@ -179,13 +185,18 @@ class KeepAway:
         monkey_business_level: int
 
 
-def parse_as_malformed_yaml(lines: list[str]) -> dict[str, dict[str, str]]:
+def parse_as_malformed_yaml(lines: Iterable[Line]) -> dict[str, dict[str, str]]:
+    import yaml
+
     return yaml.safe_load(
-        io.StringIO("".join(map(lambda line: re.sub(r"^ {4}", "  ", line), lines)))
+        io.StringIO(
+            "".join(map(lambda line: re.sub(r"^ {4}", "  ", line), text_lines(lines)))
+        )
     )
 
 
-def parse(lines: list[str]) -> Iterator[Monkey]:
+@profiled("parse")
+def parse(lines: Iterable[Line]) -> Iterator[Monkey]:
     monkey_yaml = parse_as_malformed_yaml(lines)
     for monkey_data in monkey_yaml.items():
         key, value = monkey_data
@@ -203,3 +214,28 @@ def parse(lines: list[str]) -> Iterator[Monkey]:
                 map(lambda it: Item(int(it)), str(value["Starting items"]).split(","))
             ),
         )
+
+
+def monkey_business_level(
+    monkeys: list[Monkey], num_rounds: int, operation: Item.Operation
+) -> int:
+    game = KeepAway(
+        players={m.number: m for m in monkeys},
+        operation=operation,
+        round_results=deque(maxlen=1),
+    )
+    game.play(num_rounds=num_rounds)
+    return game.round_results[-1].monkey_business_level
+
+
+SOLUTION = Solution(
+    load=lambda data_file: [*parse(stream_data(data_file))],
+    parts={
+        "part_one": lambda monkeys: monkey_business_level(
+            monkeys, 20, Item.FloorDivide(3)
+        ),
+        "part_two": lambda monkeys: monkey_business_level(
+            monkeys, 10000, Item.Mod(prod(m.test.factor for m in monkeys))
+        ),
+    },
+)
@@ -1,11 +1,20 @@
 from collections import deque
-from collections.abc import Mapping
 from dataclasses import InitVar, dataclass, field
 from enum import Enum
 from functools import cache, cached_property
-from typing import Callable, ClassVar, Iterator, Optional, Self
+from typing import Callable, ClassVar, Iterable, Iterator, Optional, Self
 
-from src import no
+from src import (
+    Grid,
+    Line,
+    PathIndex,
+    Solution,
+    count,
+    no,
+    profiled,
+    stream_data,
+    text_lines,
+)
 
 
 @dataclass
@@ -30,76 +39,50 @@ class Square:
 @dataclass
 class Heightmap:
     elevations: InitVar[list[str]]
-    squares: list[list[Square]] = field(init=False)
+    grid: Grid = field(init=False)
 
+    _elevation_values: ClassVar[bytes] = bytes(
+        Square._elevation_keys.get(chr(code), 0) for code in range(256)
+    )
+
+    @profiled("build")
     def __post_init__(self, elevations: list[str]):
-        self.squares = [
-            list(map(lambda j: Square(j[1], (i[0], j[0]), self), enumerate(i[1])))
-            for i in enumerate(elevations)
+        self.grid = Grid.from_rows(map(str.encode, elevations))
+
+    @property
+    def squares(self) -> list[list[Square]]:
+        return [
+            [self.square_at((r, c)) for c in range(self.grid.width)]
+            for r in range(self.grid.height)
         ]
 
+    def find(self, elevation: str) -> Optional[Square]:
+        try:
+            index = self.grid.cells.index(ord(elevation))
+        except ValueError:
+            return None
+
+        return self.square_at(divmod(index, self.grid.width))
+
     @cached_property
     def current_location(self) -> Optional[Square]:
-        for row in self.squares:
-            for square in row:
-                if square.elevation == "S":
-                    return square
-
-        return None
+        return self.find("S")
 
     @cached_property
     def best_signal_location(self) -> Optional[Square]:
-        for row in self.squares:
-            for square in row:
-                if square.elevation == "E":
-                    return square
+        return self.find("E")
 
-        return None
+    def elevation_value_at(self, position: tuple[int, int]) -> int:
+        return self._elevation_values[self.grid[position]]
 
     def square_at(self, position: tuple[int, int]) -> Optional[Square]:
-        if position[0] < 0 or position[1] < 0:
-            return None
-        try:
-            return self.squares[position[0]][position[1]]
-        except IndexError:
-            return None
-
-    def neighbors_of(self, square: Square) -> Iterator[Square]:
-        row, col = square.position
-        return filter(
-            lambda x: x is not None,
-            [
-                self.square_at((row + 1, col)),
-                self.square_at((row - 1, col)),
-                self.square_at((row, col + 1)),
-                self.square_at((row, col - 1)),
-            ],
-        )
-
-
-@dataclass(frozen=True)
-class PathMapping(Mapping[tuple[int, int], Optional[list[tuple[int, int]]]]):
-    _start_position: tuple[int, int]
-    _previous_positions: dict[tuple[int, int], tuple[int, int]]
-
-    def __getitem__(self, key: tuple[int, int]) -> Optional[list[tuple[int, int]]]:
-        path = []
-        current = key
-        try:
-            while not current == self._start_position:
-                path.append(current)
-                current = self._previous_positions[current]
-        except KeyError:
+        if (code := self.grid.get(position)) is None:
             return None
 
-        path.append(self._start_position)
-        return path
+        return Square(chr(code), position, self)
 
-    def __len__(self) -> int:
-        return len(self._previous_positions)
-
-    def __iter__(self) -> Iterator[tuple[int, int]]:
-        return iter(self._previous_positions)
+    def neighbors_of(self, square: Square) -> Iterator[Square]:
+        return map(self.square_at, self.grid.neighbors(square.position))
 
 
 @dataclass
@@ -112,49 +95,72 @@ class Hiker:
         self.location = self.heightmap.current_location
 
     @property
-    def accessible_squares(self) -> Iterator[Square]:
-        neighbors = self.heightmap.neighbors_of(self.location)
+    def accessible_positions(self) -> Iterator[tuple[int, int]]:
+        neighbors = self.heightmap.grid.neighbors(self.location.position)
+        elevation_value_at = self.heightmap.elevation_value_at
+        elevation_value = self.location.elevation_value
         if self.search_mode == Hiker.SearchMode.FORWARD:
             return filter(
-                lambda sq: self.location.elevation_value + 1 >= sq.elevation_value,
-                neighbors,
+                lambda p: elevation_value + 1 >= elevation_value_at(p), neighbors
             )
         else:
             return filter(
-                lambda sq: sq.elevation_value + 1 >= self.location.elevation_value,
-                neighbors,
+                lambda p: elevation_value_at(p) + 1 >= elevation_value, neighbors
             )
 
-    def navigate(self, should_stop: Callable[[Square], bool] = no):
-        start: tuple[int, int] = self.location.position
-        previous: dict[tuple[int, int], tuple[int, int]] = {}
+    @property
+    def accessible_squares(self) -> Iterator[Square]:
+        return map(self.heightmap.square_at, self.accessible_positions)
 
-        discovered: set[tuple[int, int]] = set()
-        unexplored: deque[Square] = deque([self.location])
+    @profiled("solve")
+    def navigate(self, should_stop: Callable[[Square], bool] = no):
+        paths: PathIndex[tuple[int, int]] = PathIndex(self.location.position)
+        unexplored: deque[tuple[int, int]] = deque([self.location.position])
+        expansions = 0
 
         while len(unexplored) > 0:
-            self.location = unexplored.popleft()
+            self.location = self.heightmap.square_at(unexplored.popleft())
             if should_stop(self.location):
                 break
 
-            newly_discovered = list(
-                sq for sq in self.accessible_squares if sq.position not in discovered
-            )
+            expansions += 1
+            newly_discovered = [p for p in self.accessible_positions if p not in paths]
             unexplored.extend(newly_discovered)
-            previous.update(
-                {sq.position: self.location.position for sq in newly_discovered}
-            )
-            discovered.update(sq.position for sq in newly_discovered)
+            for position in newly_discovered:
+                paths.add(position, self.location.position)
 
-        return PathMapping(start, previous)
+        count("day12.Hiker.expansions", expansions)
+        return paths
 
     class SearchMode(Enum):
         FORWARD = "forward"
         REVERSE = "reverse"
 
 
-def parse(lines: list[str]) -> Hiker:
+@profiled("parse")
+def parse(lines: Iterable[Line]) -> Hiker:
     return Hiker(
-        heightmap=Heightmap([line.strip() for line in lines]),
+        heightmap=Heightmap([line.strip() for line in text_lines(lines)]),
         search_mode=Hiker.SearchMode.FORWARD,
     )
+
+
+def fewest_steps_to_best_signal(hiker: Hiker) -> int:
+    paths = hiker.navigate()
+    return paths.depth(hiker.heightmap.best_signal_location.position)
+
+
+def fewest_steps_from_any_low_square(hiker: Hiker) -> int:
+    hiker.location = hiker.heightmap.best_signal_location
+    hiker.search_mode = Hiker.SearchMode.REVERSE
+    paths = hiker.navigate(should_stop=lambda sq: sq.elevation == "a")
+    return paths.depth(hiker.location.position)
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(stream_data(data_file)),
+    parts={
+        "part_one": fewest_steps_to_best_signal,
+        "part_two": fewest_steps_from_any_low_square,
+    },
+)
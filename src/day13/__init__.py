@@ -1,7 +1,9 @@
 import json
 from dataclasses import dataclass
 from functools import total_ordering
-from typing import Iterator, Union
+from typing import ClassVar, Iterable, Iterator, Union
+
+from src import Line, Solution, count, profiled, stream_data, text_lines
 
 PacketData = list[Union[int, "PacketData"]]
 
@@ -10,11 +12,13 @@ PacketData = list[Union[int, "PacketData"]]
 @dataclass(frozen=True)
 class Packet:
     data: PacketData
+    comparisons: ClassVar[int] = 0
 
     def __gt__(self, other):
         if not isinstance(other, Packet):
             return NotImplemented
 
+        Packet.comparisons += 1
         for items in zip(self.data, other.data):
             if isinstance(items[0], int) and isinstance(items[1], int):
                 if items[0] > items[1]:
@@ -34,18 +38,46 @@ class Packet:
         return len(self.data) > len(other.data)
 
 
-def parse_pairs(lines: list[str]) -> Iterator[tuple[Packet, Packet]]:
+def parse_pairs(lines: Iterable[Line]) -> Iterator[tuple[Packet, Packet]]:
     return zip(*([parse(lines)] * 2))
 
 
-def parse(lines: list[str]) -> Iterator[Packet]:
-    return (Packet(json.loads(line)) for line in lines if not line.isspace())
+@profiled("parse")
+def parse(lines: Iterable[Line]) -> Iterator[Packet]:
+    for line in text_lines(lines):
+        if not line.isspace():
+            yield Packet(json.loads(line))
 
 
+@profiled("solve")
 def get_decoder_key(
     packets: Iterator[Packet], divider_packets: tuple[Packet, Packet]
 ) -> int:
+    comparisons = Packet.comparisons
     sorted_packets = sorted([*packets, divider_packets[0], divider_packets[1]])
+    count("day13.Packet.comparisons", Packet.comparisons - comparisons)
     return (sorted_packets.index(divider_packets[0]) + 1) * (
         sorted_packets.index(divider_packets[1]) + 1
     )
+
+
+def sum_ordered_pair_indices(packets: list[Packet]) -> int:
+    comparisons = Packet.comparisons
+    total = sum(
+        i + 1
+        for i, (left, right) in enumerate(zip(packets[::2], packets[1::2]))
+        if left < right
+    )
+    count("day13.Packet.comparisons", Packet.comparisons - comparisons)
+    return total
+
+
+SOLUTION = Solution(
+    load=lambda data_file: [*parse(stream_data(data_file))],
+    parts={
+        "part_one": lambda packets: sum_ordered_pair_indices(packets),
+        "part_two": lambda packets: get_decoder_key(
+            iter(packets), divider_packets=(Packet([[2]]), Packet([[6]]))
+        ),
+    },
+)
@@ -6,7 +6,17 @@ from itertools import chain, pairwise, tee
 from math import copysign
 from typing import Callable, Iterable, Iterator, Optional, Protocol, Self, overload
 
-from src import PathMapping, no
+from src import (
+    Grid,
+    Line,
+    PathIndex,
+    Solution,
+    count,
+    no,
+    profiled,
+    stream_data,
+    text_lines,
+)
 
 Location = tuple[int, int]
 Extent = tuple[Location, Location]
@@ -204,10 +214,34 @@ class Cave:
     structures: frozenset[Structure, ...]
     sand_units: dict[Location, Sand.Unit] = field(default_factory=dict)
     sand_source: Sand.Source = Sand.Source(location=(500, 0))
-    _rocks: frozenset[Rock] = field(init=False, compare=False, repr=False)
+    _rocks: Grid = field(init=False, compare=False, repr=False)
+    _rocks_origin: Location = field(init=False, compare=False, repr=False)
 
+    @profiled("build")
     def __post_init__(self):
-        self._rocks = frozenset(chain.from_iterable(self.structures))
+        (min_x, min_y), (max_x, max_y) = total_extent(
+            chain(
+                ((self.sand_source.location,) * 2,), (s.extent for s in self.structures)
+            )
+        )
+        self._rocks = Grid(max_y - min_y + 1, max_x - min_x + 1)
+        self._rocks_origin = (min_x, min_y)
+        for structure in self.structures:
+            for segment in structure.segments:
+                (low_x, low_y), (high_x, high_y) = segment.extent
+                for x in range(low_x, high_x + 1):
+                    for y in range(low_y, high_y + 1):
+                        self._rocks[y - min_y, x - min_x] = 1
+
+    def _rock_at(self, location: Location) -> bool:
+        return bool(
+            self._rocks.get(
+                (
+                    location[1] - self._rocks_origin[1],
+                    location[0] - self._rocks_origin[0],
+                )
+            )
+        )
 
     @property
     def extent(self) -> Extent:
@@ -215,50 +249,63 @@ class Cave:
 
     def render(self, canvas):
         self.sand_source.render(canvas)
-        for rock in self._rocks:
-            rock.render(canvas)
+        min_x, min_y = self._rocks_origin
+        for row, column in self._rocks.positions():
+            if self._rocks[row, column]:
+                Rock((column + min_x, row + min_y)).render(canvas)
 
         for unit in self.sand_units.values():
             unit.render(canvas)
 
     def inspect(self, location: Location) -> Optional[Locatable]:
-        if Rock(location) in self._rocks:
+        if self._rock_at(location):
             return Rock(location)
 
         if unit := self.sand_units.get(location):
             return unit
 
+    @profiled("solve")
     def simulate(
         self, should_stop: Callable[[Self, Optional[Sand.Unit]], bool] = no
     ) -> Iterator[SimulationState]:
         current_unit = self.sand_source.generate()
-        previous: dict[Location, Location] = {}
-        state = SimulationState(paths=PathMapping(self.sand_source.location, previous))
+        paths: PathIndex[Location] = PathIndex(self.sand_source.location)
+        state = SimulationState(paths=paths)
         empty_locations: list[Location] = [current_unit.location]
-
-        while not should_stop(self, current_unit):
-            adjacent_empty_locations = list(
-                filter(
-                    lambda it: it if not self.inspect(it) else None,
-                    possible_next_locations(current_unit),
+        steps = inspections = 0
+
+        try:
+            while not should_stop(self, current_unit):
+                steps += 1
+                next_locations = possible_next_locations(current_unit)
+                inspections += len(next_locations)
+                adjacent_empty_locations = list(
+                    filter(
+                        lambda it: it if not self.inspect(it) else None,
+                        next_locations,
+                    )
                 )
-            )
 
-            empty_locations.extend(reversed(adjacent_empty_locations))
-            previous.update(
-                {adj: current_unit.location for adj in adjacent_empty_locations}
-            )
-            if len(adjacent_empty_locations) == 0:
-                self.sand_units[current_unit.location] = current_unit
-                empty_locations.pop()
-                yield state
+                empty_locations.extend(reversed(adjacent_empty_locations))
+                for adj in adjacent_empty_locations:
+                    paths.add(adj, current_unit.location)
+                if len(adjacent_empty_locations) == 0:
+                    self.sand_units[current_unit.location] = current_unit
+                    empty_locations.pop()
+                    count("day14.Cave.sand_steps", steps)
+                    count("day14.Cave.inspections", inspections)
+                    steps = inspections = 0
+                    yield state
 
-                if len(empty_locations) == 0:
-                    break
+                    if len(empty_locations) == 0:
+                        break
 
-                current_unit = self.sand_source.generate()
+                    current_unit = self.sand_source.generate()
 
-            current_unit.location = empty_locations[-1]
+                current_unit.location = empty_locations[-1]
+        finally:
+            count("day14.Cave.sand_steps", steps)
+            count("day14.Cave.inspections", inspections)
 
     @staticmethod
     @cache
@@ -274,32 +321,31 @@ class Cave:
 @dataclass
 class Canvas:
     extent: Extent
-    content: list[list[str]] = field(init=False)
+    content: Grid = field(init=False)
 
     def __post_init__(self):
-        self.content = [
-            ["." for _ in range(self.extent[0][0], self.extent[1][0] + 1)]
-            for _ in range(self.extent[0][1], self.extent[1][1] + 1)
-        ]
+        self.content = Grid(
+            self.extent[1][1] - self.extent[0][1] + 1,
+            self.extent[1][0] - self.extent[0][0] + 1,
+            fill=ord("."),
+        )
 
     def draw(self, symbol: str, location: Location):
-        self.content[location[1] - self.extent[0][1]][
-            location[0] - self.extent[0][0]
-        ] = symbol
+        self.content[
+            location[1] - self.extent[0][1], location[0] - self.extent[0][0]
+        ] = ord(symbol)
 
     def print(self, frame: Optional[Extent] = None) -> list[str]:
         _frame: Extent = frame or self.extent
-        v_slice = slice(
+        v_range = range(
             _frame[0][1] - self.extent[0][1],
-            len(self.content) + _frame[1][1] - self.extent[1][1],
+            self.content.height + _frame[1][1] - self.extent[1][1],
         )
         h_slice = slice(
             _frame[0][0] - self.extent[0][0],
-            len(self.content[0]) + _frame[1][0] - self.extent[1][0],
+            self.content.width + _frame[1][0] - self.extent[1][0],
         )
-        return [
-            "".join(symbol for symbol in row[h_slice]) for row in self.content[v_slice]
-        ]
+        return [self.content.row(r)[h_slice].tobytes().decode() for r in v_range]
 
 
 def with_floor(
@@ -320,6 +366,34 @@ def possible_next_locations(unit: Sand.Unit) -> tuple[Location, Location, Locati
     )
 
 
-def parse(data: list[str]) -> frozenset[Structure]:
-    structures = (Structure.from_str(line.strip()) for line in data)
+@profiled("parse")
+def parse(data: Iterable[Line]) -> frozenset[Structure]:
+    structures = (Structure.from_str(line.strip()) for line in text_lines(data))
     return frozenset(structures)
+
+
+def falls_into_abyss(cave: Cave, current_unit: Optional[Sand.Unit]) -> bool:
+    if current_unit is None:
+        return False
+
+    (min_x, min_y), (max_x, max_y) = cave.extent
+    x, y = current_unit.location
+    return not (min_x <= x <= max_x and min_y <= y <= max_y)
+
+
+def count_resting_sand(cave: Cave, should_stop=no) -> int:
+    for _ in cave.simulate(should_stop=should_stop):
+        continue
+
+    return len(cave.sand_units)
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(stream_data(data_file)),
+    parts={
+        "part_one": lambda structures: count_resting_sand(
+            Cave(structures), should_stop=falls_into_abyss
+        ),
+        "part_two": lambda structures: count_resting_sand(Cave(with_floor(structures))),
+    },
+)
@@ -1,8 +1,11 @@
 import re
 from collections.abc import Container
 from dataclasses import InitVar, dataclass, field
+from itertools import chain
 from typing import Any, Iterable, Iterator, Optional, Self, overload
 
+from src import Line, Solution, profiled, stream_data, text_lines
+
 Location = tuple[int, int]
 
 
@@ -100,11 +103,12 @@ class Scanner:
         return Interval(start=(x - (r - h), row.y), end=(x + (r - h), row.y))
 
 
-def parse(data: list[str]) -> tuple[set[Scanner], set[Beacon]]:
+@profiled("parse")
+def parse(data: Iterable[Line]) -> tuple[set[Scanner], set[Beacon]]:
     scanners: set[Scanner] = set()
     beacons: set[Beacon] = set()
 
-    for line in data:
+    for line in text_lines(data):
         scanner_x, scanner_y, beacon_x, beacon_y = re.match(
             r"Sensor at x=(-?\d+), y=(-?\d+): closest beacon is at x=(-?\d+), y=(-?\d+)",
             line,
@@ -120,3 +124,22 @@ def parse(data: list[str]) -> tuple[set[Scanner], set[Beacon]]:
         beacons.add(Beacon(location=beacon_location))
 
     return scanners, beacons
+
+
+@profiled("solve")
+def count_positions_without_beacon(
+    scanners: set[Scanner], beacons: set[Beacon], row: Row
+) -> int:
+    scans = (s.scan(row) for s in scanners)
+    intervals = Interval.merge(filter(lambda it: it is not None, scans))
+    return sum(map(len, intervals)) - sum(
+        map(lambda it: it.location[1] == row.y, chain(scanners, beacons))
+    )
+
+
+SOLUTION = Solution(
+    load=lambda data_file: parse(stream_data(data_file)),
+    parts={
+        "part_one": lambda data: count_positions_without_beacon(*data, Row(2000000)),
+    },
+)
@@ -0,0 +1,67 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from src import DAYS
+from src.cache import ParseCache, content_hash
+
+
+@dataclass(frozen=True)
+class Job:
+    day: str
+    data_file: str
+    cache: Optional[ParseCache] = None
+
+
+def day_name(value: str) -> str:
+    return f"day{int(value.removeprefix('day')):02d}"
+
+
+def default_input(day: str) -> str:
+    return str(Path(__file__).parent / day / "input.txt")
+
+
+def jobs_for(
+    days: Iterable[str],
+    data_files: Iterable[str] = (),
+    cache: Optional[ParseCache] = None,
+) -> list[Job]:
+    data_files = [*data_files]
+    if len(data_files) == 0:
+        return [Job(day, default_input(day), cache) for day in days]
+
+    return [Job(day, data_file, cache) for day, data_file in product(days, data_files)]
+
+
+def run_job(job: Job) -> dict[str, Any]:
+    result: dict[str, Any] = {"day": job.day, "input": job.data_file}
+    timings: dict[str, float] = {}
+    answers: dict[str, Any] = {}
+    try:
+        solution = DAYS.solution(job.day)
+        cache = job.cache or ParseCache(enabled=False)
+        data_file = Path(job.data_file)
+        digest = content_hash(data_file) if cache.enabled else None
+        for name, part in solution.parts.items():
+            start = time.perf_counter()
+            data = cache.load(job.day, data_file, digest)
+            timings.setdefault("load", time.perf_counter() - start)
+
+            start = time.perf_counter()
+            answers[name] = part(data)
+            timings[name] = time.perf_counter() - start
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    return result | {"answers": answers, "timings": timings}
+
+
+def run_jobs(jobs: Iterable[Job], processes: Optional[int] = None) -> Iterator[dict]:
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+        futures = [executor.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
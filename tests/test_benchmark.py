@@ -0,0 +1,181 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import DAYS
+from src.benchmark import (
+    GENERATORS,
+    Measurement,
+    Regression,
+    baseline,
+    baseline_cases,
+    calibrated,
+    compare,
+    measure_imports,
+    report,
+    run,
+    run_loaders,
+    write_input,
+)
+from src.benchmark.__main__ import main
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_generated_inputs_are_solvable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for day in GENERATORS:
+                with self.subTest(day=day):
+                    solution = DAYS.solution(day)
+                    data_file = write_input(day, 4, Path(directory))
+                    for part in solution.parts.values():
+                        self.assertIsNotNone(part(solution.load(data_file)))
+
+    def test_generated_inputs_are_reproducible(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = write_input("day08", 10, Path(directory)).read_text()
+            second = write_input("day08", 10, Path(directory)).read_text()
+            self.assertEqual(first, second)
+            self.assertEqual(10, len(first.splitlines()))
+
+    def test_report(self):
+        results = json.loads(json.dumps(report(run(["day01"], [5, 10], repeat=2))))
+        self.assertEqual(
+            [
+                (5, "load"),
+                (5, "part_one"),
+                (5, "part_two"),
+                (10, "load"),
+                (10, "part_one"),
+                (10, "part_two"),
+            ],
+            [(m["size"], m["phase"]) for m in results["measurements"]],
+        )
+        self.assertTrue(all(len(m["samples"]) == 2 for m in results["measurements"]))
+
+    def test_run_loaders(self):
+        measurements = [*run_loaders(["day04", "day06"], [10], repeat=2)]
+        self.assertEqual(
+            [
+                ("day04", "load"),
+                ("day04", "load_columns"),
+                ("day04", "iter_bounds"),
+                ("day06", "load"),
+            ],
+            [(m.day, m.phase) for m in measurements],
+        )
+        self.assertTrue(all(m.throughput > 0 for m in measurements))
+
+    def test_measure_imports(self):
+        measurements = [*measure_imports(["src.day06"], repeat=2)]
+        self.assertEqual(["src.day06"], [m.day for m in measurements])
+        self.assertEqual(2, len(measurements[0].samples))
+        self.assertGreater(measurements[0].median, 0)
+
+    def test_baseline(self):
+        measurements = [*run(["day06"], [5, 10], repeat=3)]
+        entries = json.loads(json.dumps(baseline(measurements)))["entries"]
+        self.assertEqual(
+            ["day06/load/5", "day06/part_one/5", "day06/part_two/5"],
+            [*entries][:3],
+        )
+        self.assertTrue(all(e["peak_memory"] > 0 for e in entries.values()))
+        self.assertTrue(all(e["calibration"] > 0 for e in entries.values()))
+        self.assertEqual({"day06": [5, 10]}, baseline_cases(entries))
+
+    def test_compare(self):
+        entries = {
+            "day01/load/10": {
+                "median": 1.0,
+                "deviation": 0.1,
+                "peak_memory": 10**6,
+                "calibration": 0.02,
+            },
+        }
+
+        def current(samples, peak_memory=10**6, calibration=0.02):
+            return [
+                Measurement("day01", 10, 0, "load", samples, peak_memory, calibration)
+            ]
+
+        self.assertEqual([], [*compare(entries, current([1.2, 1.2, 1.2]))])
+        self.assertEqual([], [*compare(entries, current([1.0, 1.3, 2.0]))])
+        self.assertEqual(
+            [Regression("day01/load/10", "time", 1.0, 1.5)],
+            [*compare(entries, current([1.5, 1.5, 1.5]))],
+        )
+        self.assertEqual(
+            [Regression("day01/load/10", "memory", 10**6, 2 * 10**6)],
+            [*compare(entries, current([1.0], peak_memory=2 * 10**6))],
+        )
+        self.assertEqual([], [*compare(entries, current([1.8], calibration=0.03))])
+        self.assertEqual([], [*compare(entries, current([1.2], calibration=None))])
+        self.assertEqual([], [*compare({}, current([9.0]))])
+
+    def test_calibrated(self):
+        measurements = [*calibrated(run(["day06", "day01"], [5], repeat=1))]
+        self.assertEqual(6, len(measurements))
+        self.assertTrue(all(m.calibration > 0 for m in measurements))
+
+    def test_check_baseline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "baseline.json")
+            self.assertEqual(
+                0, main(["--days", "day10", "--sizes", "20", "--record-baseline", path])
+            )
+
+            with open(path) as data:
+                recorded = json.load(data)
+            for entry in recorded["entries"].values():
+                entry["deviation"] = 0
+            recorded["entries"]["day10/part_two/20"]["median"] /= 10
+            with open(path, "w") as data:
+                json.dump(recorded, data)
+
+            with contextlib.redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(1, main(["--check-baseline", path]))
+            self.assertIn("day10/part_two/20: time regressed", errors.getvalue())
+
+    def test_compare_uniform_slowdown(self):
+        entries = {
+            f"day10/{phase}/20": {
+                "median": 0.01,
+                "deviation": 0.0001,
+                "peak_memory": None,
+                "calibration": 0.02,
+            }
+            for phase in ("load", "part_one", "part_two")
+        }
+        measurements = [
+            Measurement("day10", 20, 0, phase, [0.02, 0.02, 0.021], None, 0.02)
+            for phase in ("load", "part_one", "part_two")
+        ]
+        self.assertEqual([*entries], [r.key for r in compare(entries, measurements)])
+
+    def test_check_baseline_attempts(self):
+        slow = Regression("day10/part_two/20", "time", 1.0, 2.0)
+        noisy = Regression("day10/load/20", "time", 1.0, 2.0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = str(Path(directory) / "baseline.json")
+            with open(path, "w") as data:
+                json.dump({"entries": {slow.key: {}, noisy.key: {}}}, data)
+
+            with mock.patch(
+                "src.benchmark.__main__.find_regressions",
+                side_effect=[[slow, noisy], [slow], [slow], [slow]],
+            ) as finding, contextlib.redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(1, main(["--check-baseline", path]))
+            self.assertEqual(4, finding.call_count)
+            self.assertEqual([slow.key], [*finding.call_args.args[0]])
+            self.assertIn("day10/part_two/20: time regressed", errors.getvalue())
+            self.assertNotIn("day10/load/20", errors.getvalue())
+
+            with mock.patch(
+                "src.benchmark.__main__.find_regressions",
+                side_effect=[[slow], [slow], []],
+            ) as finding:
+                self.assertEqual(0, main(["--check-baseline", path]))
+            self.assertEqual(3, finding.call_count)
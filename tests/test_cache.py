@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import DAYS, cache
+from src.cache import CACHE_DIRECTORY_NAME, ParseCache, code_hash, content_hash
+
+
+class CacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def copy_input(self, day: str) -> Path:
+        data_file = self.directory / day / "input.txt"
+        data_file.parent.mkdir()
+        shutil.copy(Path(__file__).parent / f"../src/{day}/input.txt", data_file)
+        return data_file
+
+    def test_load(self):
+        cache = ParseCache()
+        for day in DAYS:
+            with self.subTest(day=day):
+                data_file = self.copy_input(day)
+                expected = DAYS.solution(day).load(data_file)
+                self.assertEqual(expected, cache.load(day, data_file))
+                self.assertTrue(cache.path_for(day, data_file).exists())
+                self.assertEqual(expected, cache.load(day, data_file))
+
+    def test_content_changes(self):
+        cache = ParseCache()
+        data_file = self.copy_input("day01")
+        first = cache.load("day01", data_file)
+        data_file.write_text("1\n2\n\n3\n")
+        second = cache.load("day01", data_file)
+        self.assertNotEqual(first, second)
+        self.assertEqual(2, len(second))
+
+    def test_disabled(self):
+        data_file = self.copy_input("day04")
+        ParseCache(enabled=False).load("day04", data_file)
+        self.assertFalse((data_file.parent / CACHE_DIRECTORY_NAME).exists())
+
+    def test_evict(self):
+        cache = ParseCache(max_bytes=1)
+        data_file = self.copy_input("day01")
+        cache.load("day01", data_file)
+        self.assertEqual([], [*(data_file.parent / CACHE_DIRECTORY_NAME).iterdir()])
+
+    def test_code_hash(self):
+        first = code_hash("day01")
+        code_hash.cache_clear()
+        with mock.patch.object(cache, "package_version", return_value="9.9.9"):
+            self.assertNotEqual(first, code_hash("day01"))
+        code_hash.cache_clear()
+        self.assertEqual(first, code_hash("day01"))
+
+    def test_unloadable_entry(self):
+        parse_cache = ParseCache()
+        data_file = self.copy_input("day01")
+        cache_file = parse_cache.path_for("day01", data_file)
+        cache_file.parent.mkdir()
+        cache_file.write_bytes(b"csrc.cache\nMissing\n.")
+        expected = DAYS.solution("day01").load(data_file)
+        self.assertEqual(expected, parse_cache.load("day01", data_file))
+
+    def test_digest(self):
+        parse_cache = ParseCache()
+        data_file = self.copy_input("day01")
+        digest = content_hash(data_file)
+        self.assertEqual(
+            parse_cache.path_for("day01", data_file),
+            parse_cache.path_for("day01", data_file, digest),
+        )
+        with mock.patch.object(cache, "content_hash") as hashing:
+            parse_cache.load("day01", data_file, digest)
+        hashing.assert_not_called()
@@ -1,20 +1,34 @@
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from src import day01, map_data
 from src.day01 import (
+    CalorieAggregator,
     Elf,
     FoodItem,
+    Inventory,
+    calorie_totals,
+    chunk_boundaries,
     get_max_elf_calorie_count,
     get_top_three_elf_calorie_counts,
     load,
+    load_inventory,
+    parallel_top_k,
+    parse_inventory,
+    summarize_chunk,
+    top_k,
 )
 
 
 class Day01Tests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.example = load(Path(__file__).parent / "resources/day01/example.txt")
-        cls.input = load(Path(__file__).parent / "../src/day01/input.txt")
+        cls.example_file = Path(__file__).parent / "resources/day01/example.txt"
+        cls.input_file = Path(__file__).parent / "../src/day01/input.txt"
+        cls.example = load(cls.example_file)
+        cls.input = load(cls.input_file)
 
     def test_load_example(self):
         self.assertEqual(
@@ -64,3 +78,111 @@ class Day01Tests(unittest.TestCase):
     def test_solutions(self):
         self.assertEqual(get_max_elf_calorie_count(self.input), 68292)
         self.assertEqual(sum(get_top_three_elf_calorie_counts(self.input)), 203203)
+
+    def test_calorie_totals(self):
+        self.assertEqual(
+            [6000, 4000, 11000, 24000, 10000],
+            [*calorie_totals(map_data(self.example_file))],
+        )
+        self.assertEqual([3, 4], [*calorie_totals(["1\n", "2\n", "\n", "\n", "4"])])
+        self.assertEqual([], [*calorie_totals([])])
+
+    def test_top_k(self):
+        with mock.patch.object(
+            day01, "Elf", side_effect=AssertionError
+        ), mock.patch.object(day01, "FoodItem", side_effect=AssertionError):
+            self.assertEqual([24000, 11000, 10000], top_k(self.example_file, 3))
+            self.assertEqual([24000], top_k(str(self.example_file), 1))
+            self.assertEqual(
+                [24000, 11000, 10000, 6000, 4000], top_k(map_data(self.example_file), 9)
+            )
+            self.assertEqual(203203, sum(top_k(self.input_file, 3)))
+
+    def test_inventory(self):
+        inventory = load_inventory(self.example_file)
+        self.assertEqual(self.example, [*inventory])
+        self.assertEqual(Elf([FoodItem(10000)]), inventory[-1])
+        self.assertEqual([6000, 4000, 11000, 24000, 10000], inventory.totals.tolist())
+        self.assertEqual(24000, inventory.max())
+        self.assertEqual([24000, 11000, 10000], inventory.top_k(3))
+        self.assertEqual(4000, inventory.percentile(0))
+        self.assertEqual(10000, inventory.percentile(50))
+        self.assertEqual(24000, inventory.percentile(100))
+        self.assertEqual(15000, inventory.range_sum(1, 3))
+        self.assertEqual(55000, inventory.range_sum(0, 99))
+        self.assertEqual(0, inventory.range_sum(3, 1))
+        with self.assertRaises(IndexError):
+            inventory[5]
+        with self.assertRaises(ValueError):
+            inventory.percentile(101)
+        with self.assertRaises(ValueError):
+            Inventory().percentile(50)
+
+        self.assertEqual(inventory, parse_inventory(map_data(self.example_file)))
+        self.assertEqual(
+            [3, 4],
+            parse_inventory(["\n", "1\n", "2\n", "\n", "\n", "4"]).totals.tolist(),
+        )
+
+    def test_inventory_solutions(self):
+        inventory = load_inventory(self.input_file)
+        self.assertEqual(68292, inventory.max())
+        self.assertEqual(203203, sum(inventory.top_k(3)))
+
+    def test_chunk_boundaries(self):
+        data = self.input_file.read_bytes()
+        for chunks in (1, 2, 7, 10**6):
+            with self.subTest(chunks=chunks):
+                ranges = chunk_boundaries(self.input_file, chunks)
+                self.assertEqual(0, ranges[0][0])
+                self.assertEqual(len(data), ranges[-1][1])
+                for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                    self.assertEqual(end, start)
+                    self.assertEqual(b"\n\n", data[start - 2 : start])
+
+    def test_summarize_chunk(self):
+        size = self.example_file.stat().st_size
+        self.assertEqual([24000, 11000], summarize_chunk(self.example_file, 0, size, 2))
+        self.assertEqual([6000], summarize_chunk(self.example_file, 0, 16, 2))
+
+    def test_parallel_top_k(self):
+        self.assertEqual(
+            top_k(self.input_file, 3), parallel_top_k(self.input_file, 3, processes=2)
+        )
+        self.assertEqual(
+            [24000, 11000, 10000],
+            parallel_top_k(self.example_file, 3, processes=2, chunks=5),
+        )
+
+    def test_calorie_aggregator(self):
+        aggregator = CalorieAggregator()
+        aggregator.update(["1000\n", "2000\n", "\n", "4000\n", "\n", "5000"])
+        self.assertEqual([5000, 4000, 3000], aggregator.top_k())
+        aggregator.update(["6000\n"])
+        self.assertEqual([11000, 4000, 3000], aggregator.top_k())
+        aggregator.update(["\n", "7000\n"])
+        self.assertEqual([11000, 7000, 4000], aggregator.top_k())
+        self.assertEqual(11000, aggregator.max())
+
+        aggregator = CalorieAggregator.from_totals([6000, 4000, 11000], k=2)
+        aggregator.update(["24000\n"])
+        self.assertEqual([24000, 11000], aggregator.top_k())
+
+        aggregator = CalorieAggregator(k=2)
+        aggregator.update(["1000", "2000", "", "3000"])
+        self.assertEqual([3000, 3000], aggregator.top_k())
+
+    def test_calorie_aggregator_appends(self):
+        data = self.input_file.read_bytes()
+        aggregator = CalorieAggregator()
+        with tempfile.TemporaryDirectory() as directory:
+            data_file = Path(directory) / "calories.txt"
+            data_file.touch()
+            for end in (1, 500, 501, 4000, 4001, 4002, len(data) // 2, len(data)):
+                with open(data_file, "ab") as appended:
+                    appended.write(data[aggregator.offset : end])
+                aggregator.update_from(data_file)
+                with self.subTest(end=end):
+                    self.assertEqual(top_k(data_file, 3), aggregator.top_k())
+
+        self.assertEqual(68292, aggregator.max())
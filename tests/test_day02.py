@@ -1,7 +1,19 @@
+import pickle
 import unittest
+from collections import Counter
 from pathlib import Path
 
-from src.day02 import Play, Player, Round, Tournament, load
+from src.day02 import (
+    SCORE_TABLE,
+    Play,
+    Player,
+    Round,
+    Tournament,
+    TournamentTally,
+    load,
+    load_tallies,
+    load_tally,
+)
 
 
 class Day02Tests(unittest.TestCase):
@@ -75,3 +87,78 @@ class Day02Tests(unittest.TestCase):
     def test_solutions(self):
         self.assertEqual(14264, self.input.player_two_score)
         self.assertEqual(12382, self.input_by_outcome_mapping.player_two_score)
+
+    def test_score_table(self):
+        self.assertEqual(9, len(SCORE_TABLE))
+        self.assertEqual((1, 8), SCORE_TABLE[Play.ROCK, Play.PAPER])
+        self.assertEqual((6, 6), SCORE_TABLE[Play.SCISSORS, Play.SCISSORS])
+
+    def test_tournament_tally(self):
+        example_file = Path(__file__).parent / "resources/day02/example.txt"
+        tally = load_tally(example_file)
+        self.assertEqual(
+            TournamentTally(
+                Counter(
+                    {
+                        (Play.ROCK, Play.PAPER): 1,
+                        (Play.PAPER, Play.ROCK): 1,
+                        (Play.SCISSORS, Play.SCISSORS): 1,
+                    }
+                )
+            ),
+            tally,
+        )
+        self.assertEqual(TournamentTally.from_tournament(self.example), tally)
+        self.assertEqual(15, tally.player_one_score)
+        self.assertEqual(15, tally.player_two_score)
+        self.assertEqual(
+            12, load_tally(example_file, Round.by_outcome_mapping).player_two_score
+        )
+
+    def test_tally_solutions(self):
+        input_file = Path(__file__).parent / "../src/day02/input.txt"
+        self.assertEqual(14264, load_tally(input_file).player_two_score)
+        self.assertEqual(
+            12382, load_tally(input_file, Round.by_outcome_mapping).player_two_score
+        )
+
+    def test_load_tallies(self):
+        input_file = Path(__file__).parent / "../src/day02/input.txt"
+        expected = (
+            load_tally(input_file),
+            load_tally(input_file, Round.by_outcome_mapping),
+        )
+        for use_mmap in (False, True):
+            for chunk_size in (1, 2, 3, 7, 2**24):
+                with self.subTest(use_mmap=use_mmap, chunk_size=chunk_size):
+                    self.assertEqual(
+                        expected,
+                        load_tallies(
+                            input_file, use_mmap=use_mmap, chunk_size=chunk_size
+                        ),
+                    )
+
+        play, outcome = load_tallies(input_file, use_mmap=True)
+        self.assertEqual(
+            (14264, 12382), (play.player_two_score, outcome.player_two_score)
+        )
+
+    def test_rounds_are_interned(self):
+        self.assertIs(Round(Play.ROCK, Play.PAPER), Round.by_play_mapping("A Y"))
+        self.assertIs(Round.by_play_mapping("B Y"), Round.by_outcome_mapping("B Y"))
+        self.assertIs(
+            self.input.rounds[0], pickle.loads(pickle.dumps(self.input.rounds[0]))
+        )
+        self.assertEqual(
+            9, len({*self.input.rounds, *self.input_by_outcome_mapping.rounds})
+        )
+
+    def test_tournament_scores_are_cached(self):
+        tournament = Tournament([Round.by_play_mapping("A Y")])
+        self.assertEqual((1, 8), tournament.scores)
+        tournament.rounds = [Round.by_play_mapping("B X"), Round.by_play_mapping("C Z")]
+        self.assertEqual((14, 7), tournament.scores)
+        self.assertEqual(tournament, pickle.loads(pickle.dumps(tournament)))
+        with self.assertRaises(AttributeError):
+            tournament.rounds.append(Round.by_play_mapping("A Y"))
+        self.assertEqual((14, 7), tournament.scores)
@@ -1,7 +1,27 @@
+import importlib.util
+import tempfile
 import unittest
 from pathlib import Path
 
-from src.day03 import Compartment, Item, Rucksack, get_badges, get_unsorted_item, load
+from src import map_data, stream_data
+from src.day03 import (
+    Compartment,
+    Item,
+    Rucksack,
+    RucksackManifest,
+    badge_priority_total,
+    find_badges,
+    get_badges,
+    get_unsorted_item,
+    item_from_mask,
+    item_mask,
+    load,
+    load_masks,
+    load_priority_aggregates,
+    map_manifest,
+    priority_aggregates,
+    unsorted_priority_total,
+)
 
 
 class Day03Tests(unittest.TestCase):
@@ -64,6 +84,10 @@ class Day03Tests(unittest.TestCase):
             [Item("p"), Item("L"), Item("P"), Item("v"), Item("t"), Item("s")],
             [get_unsorted_item(r) for r in self.example],
         )
+        with self.assertRaises(ValueError):
+            get_unsorted_item(
+                Rucksack((Compartment.from_str("ab"), Compartment.from_str("cd")))
+            )
 
     def test_example_get_unsorted_item_priorities(self):
         self.assertEqual(
@@ -79,3 +103,117 @@ class Day03Tests(unittest.TestCase):
     def test_solution(self):
         self.assertEqual(7826, sum([get_unsorted_item(r).priority for r in self.input]))
         self.assertEqual(2577, sum([i.priority for i in get_badges(self.input)]))
+
+    def test_item_mask(self):
+        self.assertEqual(0b111, item_mask("abcabc"))
+        self.assertEqual(item_mask("pL"), item_mask(b"Lp"))
+        self.assertEqual(1 << 51, item_mask(memoryview(b"Z")))
+        self.assertEqual(Item("L"), item_from_mask(item_mask("L")))
+        self.assertEqual(38, item_mask("L").bit_length())
+        with self.assertRaises(ValueError):
+            item_from_mask(0)
+        self.assertEqual(item_mask("vJrwpWtwJgWrhcsFMMfFFhFp"), self.example[0].mask)
+
+    def test_masks(self):
+        example = load_masks(Path(__file__).parent / "resources/day03/example.txt")
+        self.assertEqual(
+            [
+                (r.first_compartment.mask, r.second_compartment.mask)
+                for r in self.example
+            ],
+            example,
+        )
+        self.assertEqual(157, unsorted_priority_total(example))
+        self.assertEqual(70, badge_priority_total(example))
+
+        masks = load_masks(Path(__file__).parent / "../src/day03/input.txt")
+        self.assertEqual(7826, unsorted_priority_total(masks))
+        self.assertEqual(2577, badge_priority_total(masks))
+
+    def test_manifest(self):
+        manifest = map_manifest(Path(__file__).parent / "resources/day03/example.txt")
+        self.assertEqual(self.example, [*manifest])
+        self.assertEqual(self.example[-1], manifest[-1])
+        first, second = manifest.compartments(1)
+        self.assertIsInstance(first, memoryview)
+        self.assertEqual((b"jqHRNqRjqzjGDLGL", b"rsFMfFZSrLrFZsSL"), (first, second))
+        self.assertEqual(157, unsorted_priority_total(manifest.masks()))
+        self.assertEqual(70, badge_priority_total(manifest.masks()))
+
+        manifest = RucksackManifest.from_buffer(memoryview(b"abcA\r\n\nxyXz"))
+        self.assertEqual(
+            [(b"ab", b"cA"), (b"xy", b"Xz")], [*map(manifest.compartments, range(2))]
+        )
+
+        manifest = RucksackManifest.from_buffer(memoryview(b"zz\nabcdAA\nxyXz\n")[3:])
+        self.assertEqual(
+            [(b"abc", b"dAA"), (b"xy", b"Xz")], [*map(manifest.compartments, range(2))]
+        )
+
+    def test_manifest_solution(self):
+        manifest = map_manifest(Path(__file__).parent / "../src/day03/input.txt")
+        self.assertEqual(7826, unsorted_priority_total(manifest.masks()))
+        self.assertEqual(2577, badge_priority_total(manifest.masks()))
+        with tempfile.TemporaryDirectory() as directory:
+            empty_file = Path(directory) / "empty.txt"
+            empty_file.touch()
+            self.assertEqual(0, len(map_manifest(empty_file)))
+
+    def test_find_badges(self):
+        example_file = Path(__file__).parent / "resources/day03/example.txt"
+        self.assertEqual([Item("r"), Item("Z")], [*find_badges(iter(self.example))])
+        self.assertEqual(
+            [Item("r"), Item("Z")], [*find_badges(stream_data(example_file))]
+        )
+        self.assertEqual(
+            [Item("r"), Item("Z")], [*find_badges(map_data(example_file), processes=2)]
+        )
+        self.assertEqual(
+            [Item("b"), Item("D")],
+            [*find_badges(["ab\n", "bc\n", "cD\n", "De"], group_size=2)],
+        )
+        with self.assertRaises(ValueError):
+            [*find_badges(self.example, group_size=4)]
+        with self.assertRaises(ValueError):
+            [*find_badges(["ab\n", "cd\n"], group_size=2)]
+
+    def test_find_badges_solution(self):
+        input_file = Path(__file__).parent / "../src/day03/input.txt"
+        expected = get_badges(self.input)
+        self.assertEqual(expected, [*find_badges(stream_data(input_file))])
+        self.assertEqual(
+            expected,
+            [*find_badges(map_data(input_file), processes=2, batch_size=7)],
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_priority_aggregates(self):
+        example = load_priority_aggregates(
+            Path(__file__).parent / "resources/day03/example.txt"
+        )
+        self.assertEqual([16, 38, 42, 22, 20, 19], example.unsorted_priorities.tolist())
+        self.assertEqual([18, 52], example.badge_priorities.tolist())
+        self.assertEqual((157, 70), (example.unsorted_total, example.badge_total))
+        self.assertEqual(53, len(example.badge_histogram))
+        self.assertEqual([18, 52], example.badge_histogram.nonzero()[0].tolist())
+        self.assertEqual(6, example.unsorted_histogram.sum())
+
+        aggregates = priority_aggregates(b"abcA\r\n\nxyXy\r\n", group_size=2)
+        self.assertEqual([0, 25], aggregates.unsorted_priorities.tolist())
+        self.assertEqual([0], aggregates.badge_priorities.tolist())
+        self.assertEqual(0, priority_aggregates(b"").unsorted_total)
+        aggregates = priority_aggregates(b"a\nb\nc\n")
+        self.assertEqual([0, 0, 0], aggregates.unsorted_priorities.tolist())
+        self.assertEqual([0], aggregates.badge_priorities.tolist())
+        aggregates = priority_aggregates(b"a\na\na\n")
+        self.assertEqual([0, 0, 0], aggregates.unsorted_priorities.tolist())
+        self.assertEqual([1], aggregates.badge_priorities.tolist())
+        with self.assertRaises(ValueError):
+            priority_aggregates(b"ab\ncd\n")
+
+        aggregates = load_priority_aggregates(
+            Path(__file__).parent / "../src/day03/input.txt"
+        )
+        self.assertEqual(
+            (7826, 2577), (aggregates.unsorted_total, aggregates.badge_total)
+        )
@@ -1,7 +1,19 @@
+import importlib.util
 import unittest
 from pathlib import Path
 
-from src.day04 import Assignment, load
+from src.day04 import (
+    Assignment,
+    AssignmentIndex,
+    AssignmentPairs,
+    count_containments,
+    count_overlaps,
+    iter_bounds,
+    load,
+    load_columns,
+    load_pairs,
+    parse_columns,
+)
 
 
 class Day04Tests(unittest.TestCase):
@@ -45,3 +57,113 @@ class Day04Tests(unittest.TestCase):
     def test_solution(self):
         self.assertEqual(503, sum(a.overlap(b) in set((a, b)) for (a, b) in self.input))
         self.assertEqual(827, sum(bool(a.overlap(b)) for (a, b) in self.input))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_assignment_pairs(self):
+        pairs = load_pairs(Path(__file__).parent / "resources/day04/example.txt")
+        self.assertEqual(6, len(pairs))
+        self.assertEqual(self.example, [pairs[i] for i in range(len(pairs))])
+        self.assertEqual([2, 2, 5, 2, 6, 2], pairs.first_low.tolist())
+        self.assertEqual(
+            [False, False, False, True, True, False], pairs.containment.tolist()
+        )
+        self.assertEqual(
+            [False, False, True, True, True, True], pairs.overlaps.tolist()
+        )
+        self.assertEqual([0, 0, 1, 5, 1, 3], pairs.overlap_lengths.tolist())
+        self.assertEqual((2, 4), (pairs.containment_count(), pairs.overlap_count()))
+
+        from_pairs = AssignmentPairs.from_pairs(self.example)
+        self.assertEqual(
+            pairs.overlap_lengths.tolist(), from_pairs.overlap_lengths.tolist()
+        )
+        self.assertEqual(0, len(AssignmentPairs.from_pairs([])))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_assignment_pairs_from_columns(self):
+        columns = load_columns(Path(__file__).parent / "../src/day04/input.txt")
+        pairs = AssignmentPairs.from_columns(columns)
+        self.assertEqual((503, 827), (pairs.containment_count(), pairs.overlap_count()))
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "requires numpy")
+    def test_assignment_pairs_solution(self):
+        pairs = load_pairs(Path(__file__).parent / "../src/day04/input.txt")
+        self.assertEqual(503, pairs.containment_count())
+        self.assertEqual(827, pairs.overlap_count())
+
+    def test_assignment_index(self):
+        index = AssignmentIndex.from_pairs(self.example)
+        self.assertEqual(12, len(index))
+        self.assertEqual(
+            {
+                Assignment(5, 7),
+                Assignment(7, 9),
+                Assignment(2, 8),
+                Assignment(3, 7),
+                Assignment(6, 8),
+                Assignment(4, 8),
+            },
+            set(index.stab(7)),
+        )
+        self.assertEqual(6, len(index.stab(7)))
+        self.assertEqual(
+            [(2, 3), (2, 4), (2, 6), (2, 8)],
+            sorted((a.low, a.high) for a in index.overlapping(Assignment(0, 2))),
+        )
+        self.assertEqual([], index.stab(10))
+        self.assertEqual(6, index.coverage(7))
+        self.assertEqual([0, 4, 5, 7], index.coverage_counts(1, 4))
+        self.assertEqual(
+            {Assignment(7, 9), Assignment(6, 8), Assignment(4, 8), Assignment(2, 8)},
+            set(index.overlapping_any([Assignment(9, 9), Assignment(8, 8)])),
+        )
+
+    def test_assignment_index_matches_scan(self):
+        assignments = [a for pair in self.input for a in pair]
+        index = AssignmentIndex(assignments)
+        for query in (
+            Assignment(1, 1),
+            Assignment(50, 50),
+            Assignment(10, 30),
+            Assignment(99, 120),
+        ):
+            with self.subTest(query=(query.low, query.high)):
+                expected = [a for a in assignments if query.overlap(a)]
+                self.assertEqual(
+                    sorted(map(id, expected)), sorted(map(id, index.overlapping(query)))
+                )
+                self.assertEqual(
+                    sum(query.low in a.section_ids for a in assignments),
+                    index.coverage(query.low),
+                )
+
+    def test_parse_columns(self):
+        self.assertEqual(
+            ([2, 12], [4, 13], [6, 1], [8, 100]),
+            tuple(c.tolist() for c in parse_columns(b"2-4,6-8\r\n12-13,1-100")),
+        )
+        self.assertEqual(
+            ([], [], [], []), tuple(c.tolist() for c in parse_columns(b""))
+        )
+        with self.assertRaises(ValueError):
+            parse_columns(b"2-4,6\n")
+
+    def test_columns(self):
+        example_file = Path(__file__).parent / "resources/day04/example.txt"
+        columns = load_columns(example_file)
+        self.assertEqual(
+            [(a.low, a.high, b.low, b.high) for a, b in self.example],
+            [*zip(*columns)],
+        )
+        self.assertEqual((2, 4), (count_containments(columns), count_overlaps(columns)))
+        for chunk_size in (1, 5, 2**20):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    [*zip(*columns)], [*iter_bounds(example_file, chunk_size)]
+                )
+                self.assertEqual(columns, load_columns(example_file, chunk_size))
+
+    def test_columns_solution(self):
+        columns = load_columns(Path(__file__).parent / "../src/day04/input.txt")
+        self.assertEqual(503, count_containments(columns))
+        self.assertEqual(827, count_overlaps(columns))
@@ -1,7 +1,19 @@
+import pickle
 import unittest
 from pathlib import Path
+from random import Random
 
-from src.day05 import Crate, Ship, Stack, Step, Strategy, load_data, parse
+from src.day05 import (
+    Crate,
+    CrateRope,
+    Ship,
+    Stack,
+    Step,
+    Strategy,
+    load_data,
+    parse,
+    top_crates,
+)
 
 
 class Day05Tests(unittest.TestCase):
@@ -72,3 +84,59 @@ class Day05Tests(unittest.TestCase):
         self.assertEqual(
             "NBTVTJNFJ", "".join(stack.crates[-1].label for stack in ship.stacks)
         )
+
+    def test_crate_rope(self):
+        rope = CrateRope(Crate(label) for label in "ABCDEF")
+        self.assertEqual(6, len(rope))
+        self.assertEqual(Crate("F"), rope.top)
+        taken = rope.take(4)
+        self.assertEqual(["A", "B"], [c.label for c in rope])
+        taken.reverse()
+        self.assertEqual(["F", "E", "D", "C"], [c.label for c in taken])
+        rope.put(taken)
+        self.assertEqual(0, len(taken))
+        self.assertEqual("ABFEDC", "".join(c.label for c in rope))
+        self.assertIsNone(CrateRope().top)
+
+    def test_stack_crates(self):
+        stack = Stack("1", [Crate("Z"), Crate("N")])
+        self.assertEqual((Crate("Z"), Crate("N")), stack.crates)
+        self.assertEqual(Crate("N"), stack.top)
+        with self.assertRaises(AttributeError):
+            stack.crates.append(Crate("M"))
+        self.assertEqual((Crate("Z"), Crate("N")), stack.crates)
+        stack.crates = [Crate("M")]
+        self.assertEqual((Crate("M"),), stack.crates)
+        self.assertEqual(stack, pickle.loads(pickle.dumps(stack)))
+
+    def test_run_crane_matches_lists(self):
+        rng = Random(5)
+        labels = [chr(ord("A") + i % 26) for i in range(300)]
+        for strategy in Strategy:
+            with self.subTest(strategy=strategy):
+                stacks = [[Crate(label) for label in labels[i::3]] for i in range(3)]
+                ship = Ship([Stack(str(i + 1), s) for i, s in enumerate(stacks)])
+                steps = []
+                for _ in range(500):
+                    start, end = rng.sample(range(3), 2)
+                    if stacks[start]:
+                        n = rng.randint(1, len(stacks[start]))
+                        moved = stacks[start][-n:]
+                        del stacks[start][-n:]
+                        if strategy == Strategy.CRATE_MOVER_9000:
+                            moved.reverse()
+                        stacks[end].extend(moved)
+                        steps.append(Step(n, str(start + 1), str(end + 1)))
+
+                ship.run_crane(steps, strategy=strategy)
+                self.assertEqual(
+                    [tuple(s) for s in stacks], [stack.crates for stack in ship.stacks]
+                )
+
+    def test_top_crates(self):
+        self.assertEqual(
+            "CMZ", top_crates(*parse(self.example_data), Strategy.CRATE_MOVER_9000)
+        )
+        self.assertEqual(
+            "MCD", top_crates(*parse(self.example_data), Strategy.CRATE_MOVER_9001)
+        )
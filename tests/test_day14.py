@@ -3,7 +3,7 @@ from itertools import chain
 from pathlib import Path
 from typing import Optional
 
-from src import load_data
+from src import load_data, map_data
 from src.day14 import (
     Canvas,
     Cave,
@@ -153,6 +153,12 @@ class Day14Tests(unittest.TestCase):
             self.print(cave),
         )
 
+    def test_parse_mapped_data(self):
+        self.assertEqual(
+            parse(self.input_data),
+            parse(map_data(Path(__file__).parent / "../src/day14/input.txt")),
+        )
+
     def test_solution_1(self):
         cave = Cave(structures=parse(self.input_data))
         states = cave.simulate(should_stop=current_unit_not_in_cave_extent)
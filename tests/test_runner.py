@@ -0,0 +1,53 @@
+import unittest
+from pathlib import Path
+
+from src.runner import Job, day_name, default_input, jobs_for, run_job, run_jobs
+
+
+class RunnerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.example_file = str(Path(__file__).parent / "resources/day01/example.txt")
+
+    def test_day_name(self):
+        self.assertEqual(
+            ["day01", "day05", "day14"], [*map(day_name, "1 05 day14".split())]
+        )
+
+    def test_jobs_for(self):
+        self.assertEqual(
+            [
+                Job("day01", default_input("day01")),
+                Job("day02", default_input("day02")),
+            ],
+            jobs_for(["day01", "day02"]),
+        )
+        self.assertEqual(
+            [
+                Job("day01", "a"),
+                Job("day01", "b"),
+                Job("day02", "a"),
+                Job("day02", "b"),
+            ],
+            jobs_for(["day01", "day02"], ["a", "b"]),
+        )
+
+    def test_run_job(self):
+        result = run_job(Job("day01", self.example_file))
+        self.assertEqual({"part_one": 24000, "part_two": 45000}, result["answers"])
+        self.assertEqual({"load", "part_one", "part_two"}, set(result["timings"]))
+        self.assertNotIn("error", result)
+
+    def test_run_job_error(self):
+        result = run_job(
+            Job("day01", str(Path(__file__).parent / "resources/day02/example.txt"))
+        )
+        self.assertIn("error", result)
+
+    def test_run_jobs(self):
+        jobs = jobs_for(["day01", "day04"], [self.example_file]) + jobs_for(["day05"])
+        results = [*run_jobs(jobs, processes=2)]
+        self.assertEqual(
+            sorted(job.day for job in jobs), sorted(r["day"] for r in results)
+        )
+        self.assertEqual(["day04"], [r["day"] for r in results if "error" in r])
@@ -0,0 +1,212 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src import (
+    DAYS,
+    Grid,
+    PathIndex,
+    Profiler,
+    count,
+    counting,
+    load_data,
+    map_data,
+    profiled,
+    profiling,
+    stream_data,
+    text_lines,
+)
+from src.day05 import Strategy
+from src.day05 import load as load_day05
+from src.day10 import CPU, Program
+from src.day10 import parse as parse_day10
+
+
+class SrcTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.example_file = Path(__file__).parent / "resources/day05/example.txt"
+
+    def test_stream_data(self):
+        self.assertEqual(
+            load_data(self.example_file), [*stream_data(self.example_file)]
+        )
+
+    def test_map_data(self):
+        lines = [*map_data(self.example_file)]
+        self.assertTrue(all(isinstance(line, memoryview) for line in lines))
+        self.assertEqual(
+            [line.encode() for line in load_data(self.example_file)],
+            [bytes(line) for line in lines],
+        )
+
+    def test_text_lines(self):
+        self.assertEqual(
+            load_data(self.example_file), [*text_lines(map_data(self.example_file))]
+        )
+        self.assertEqual(["a\n", "b"], [*text_lines(["a\n", b"b"])])
+
+    def test_profiling(self):
+        with profiling() as profiler:
+            ship, steps = load_day05(self.example_file)
+            ship.run_crane(steps, strategy=Strategy.CRATE_MOVER_9001)
+
+        self.assertEqual(
+            [("src.day05.parse", "parse"), ("src.day05.Ship.run_crane", "solve")],
+            [(r.name, r.phase) for r in profiler.records],
+        )
+        for record in profiler.records:
+            self.assertGreaterEqual(record.wall_time, 0)
+            self.assertGreaterEqual(record.cpu_time, 0)
+            self.assertGreater(record.peak_memory, 0)
+
+    def test_profiling_generators(self):
+        @profiled("solve")
+        def count_up(n):
+            for i in range(n):
+                yield [i] * 1000
+
+        with profiling() as profiler:
+            results = count_up(3)
+            self.assertEqual([], profiler.records)
+            self.assertEqual(3, len([*results]))
+
+        self.assertEqual(1, len(profiler.records))
+        self.assertGreater(profiler.records[0].peak_memory, 1000)
+
+    def test_profiling_equal_frames(self):
+        profiler = Profiler()
+        memory = [(100, 100), (100, 100), (100, 150), (100, 150)]
+        with mock.patch("tracemalloc.is_tracing", return_value=True), mock.patch(
+            "tracemalloc.reset_peak"
+        ), mock.patch("tracemalloc.get_traced_memory", side_effect=memory):
+            with profiler.measure("outer", "solve"):
+                with profiler.measure("inner", "solve"):
+                    pass
+
+        self.assertEqual(
+            [("inner", 50), ("outer", 50)],
+            [(r.name, r.peak_memory) for r in profiler.records],
+        )
+
+    def test_profiling_disabled(self):
+        with profiling(trace_memory=False) as profiler:
+            load_day05(self.example_file)
+
+        self.assertIsNone(profiler.records[0].peak_memory)
+        load_day05(self.example_file)
+        self.assertEqual(1, len(profiler.records))
+
+    def test_path_index(self):
+        paths = PathIndex("a")
+        paths.add("b", "a")
+        paths.add("c", "b")
+        paths.add("d", "a")
+        paths.add("a", "d")
+
+        self.assertEqual(["c", "b", "a"], paths["c"])
+        self.assertEqual(["a"], paths["a"])
+        self.assertEqual(2, paths.depth("c"))
+        self.assertEqual([2, 1, None], paths.depths(["c", "d", "e"]))
+        self.assertEqual(
+            [["c", "b", "a"], None], [w and [*w] for w in paths.walks(["c", "e"])]
+        )
+        self.assertEqual(["a", "b", "c", "d"], [*paths])
+        self.assertEqual(4, len(paths))
+        self.assertNotIn("e", paths)
+        self.assertIsNone(paths.get("e"))
+        with self.assertRaises(KeyError):
+            paths.walk("e")
+
+        paths.add("c", "d")
+        self.assertEqual(["c", "d", "a"], paths["c"])
+        self.assertEqual(2, paths.depth("c"))
+        paths.add("b", "d")
+        self.assertEqual(["b", "d", "a"], paths["b"])
+
+    def test_path_index_rejects_reparenting_subtrees(self):
+        paths = PathIndex("a")
+        paths.add("b", "a")
+        paths.add("c", "b")
+        paths.add("d", "a")
+        paths.add("e", "d")
+        with self.assertRaises(ValueError):
+            paths.add("b", "e")
+        self.assertEqual(["c", "b", "a"], paths["c"])
+        self.assertEqual(2, paths.depth("c"))
+
+    def test_day_registry(self):
+        self.assertEqual([f"day{i:02d}" for i in range(1, 16)], [*DAYS])
+        self.assertEqual("src.day01", DAYS["day01"].__name__)
+        self.assertEqual({"part_one", "part_two"}, set(DAYS.solution("day02").parts))
+        with self.assertRaises(KeyError):
+            DAYS["day99"]
+
+    def test_day_registry_imports_lazily(self):
+        script = (
+            "import sys; from src import DAYS; DAYS.solution('day11'); "
+            "print(sorted(m for m in sys.modules if m.startswith(('src.', 'yaml'))))"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, check=True, text=True
+        )
+        self.assertEqual("['src.day11']", completed.stdout.strip())
+
+    def test_grid(self):
+        grid = Grid.from_rows([[1, 2, 3], [4, 5, 6]])
+        self.assertEqual((2, 3), (grid.height, grid.width))
+        self.assertEqual(6, grid[1, 2])
+        self.assertEqual([4, 5, 6], grid.row(1).tolist())
+        self.assertEqual([2, 5], grid.column(1).tolist())
+        self.assertEqual([(1, 0), (0, 1)], [*grid.neighbors((0, 0))])
+        self.assertEqual([(0, 1), (1, 2), (1, 0)], [*grid.neighbors((1, 1))])
+        self.assertIsNone(grid.get((2, 0)))
+        self.assertNotIn((0, -1), grid)
+        with self.assertRaises(IndexError):
+            grid[0, 3]
+        with self.assertRaises(IndexError):
+            grid.row(2)
+
+        grid[0, 0] = 9
+        self.assertEqual([9, 2, 3, 4, 5, 6], grid.cells.tolist())
+        self.assertEqual(Grid(2, 3, fill=9), Grid.from_rows([[9] * 3] * 2))
+        with self.assertRaises(ValueError):
+            Grid.from_rows([[1], [1, 2]])
+
+    def test_counting(self):
+        resources = Path(__file__).parent / "resources"
+        program = parse_day10(load_data(resources / "day10/simple_example.txt"))
+        with counting() as stats:
+            count("example")
+            count("example", 2)
+            CPU().run(Program(iter(program)))
+
+        self.assertEqual({"example": 3, "day10.CPU.ticks": 5}, stats)
+        count("example")
+        CPU().run(Program(iter(program)))
+        self.assertEqual({"example": 3, "day10.CPU.ticks": 5}, stats)
+
+    def test_counting_solutions(self):
+        resources = Path(__file__).parent / "resources"
+        with counting() as stats:
+            for day in ("day11", "day12", "day13", "day14"):
+                solution = DAYS.solution(day)
+                for part in solution.parts.values():
+                    part(solution.load(resources / f"{day}/example.txt"))
+
+        self.assertEqual(
+            {
+                "day11.Monkey.throws",
+                "day12.Hiker.expansions",
+                "day13.Packet.comparisons",
+                "day14.Cave.sand_steps",
+                "day14.Cave.inspections",
+            },
+            set(stats),
+        )
+        self.assertEqual(154255, stats["day11.Monkey.throws"])
+        self.assertEqual(190, stats["day13.Packet.comparisons"])
+        self.assertEqual(192, stats["day14.Cave.sand_steps"])
+        self.assertEqual(576, stats["day14.Cave.inspections"])